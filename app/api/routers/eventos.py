@@ -11,8 +11,10 @@ Las respuestas están documentadas automáticamente en Swagger (/docs).
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import CACHE_CONTROL_PUBLICO
 from app.db.connection import get_db
 from app.crud import crud_eventos
 from app.schemas.evento import EventoCreate, EventoOut
@@ -23,6 +25,22 @@ logger = MyLogger().get_logger()
 EVENTO_NO_ENCONTRADO = "Evento no encontrado"
 EVENTO_DUPLICADO    = "Ya existe un evento con ese nombre."
 
+# Paginación de los listados
+LIMITE_POR_DEFECTO = 100
+LIMITE_MAXIMO = 1000
+
+# Validador/serializador compilado una vez para el listado de eventos
+_EVENTOS_ADAPTER = TypeAdapter(List[EventoOut])
+
+def _eventos_json(filas) -> Response:
+    """Convierte la página de eventos en JSON con el adaptador precompilado (sin pasar por `response_model`)."""
+    datos = _EVENTOS_ADAPTER.validate_python(filas, from_attributes=True)
+    return Response(
+        _EVENTOS_ADAPTER.dump_json(datos),
+        media_type="application/json",
+        headers={"Cache-Control": CACHE_CONTROL_PUBLICO}
+    )
+
 router = APIRouter(prefix="/eventos", tags=["Eventos"])
 """
 Router de FastAPI para operaciones relacionadas con eventos.
@@ -32,17 +50,29 @@ Tag: `Eventos` (para agrupar en Swagger)
 """
 
 @router.get("/", response_model=List[EventoOut], summary="Listar todos los eventos")
-async def listar_eventos(db: AsyncSession = Depends(get_db)):
+async def listar_eventos(
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    Retorna una lista de todos los eventos registrados en la base de datos.
+    Retorna una página de los eventos registrados en la base de datos.
+
+    Args:
+        limit (int): Máximo de eventos a retornar.
+        offset (int): Eventos a omitir.
 
     Returns:
         List[Evento]: Lista de eventos disponibles.
     """
-    return await crud_eventos.get_eventos(db)
+    return _eventos_json(await crud_eventos.get_eventos(db, limit, offset))
 
 @router.get("/{evento_id}", response_model=EventoOut, summary="Obtener un evento por ID")
-async def obtener_evento(evento_id: int, db: AsyncSession = Depends(get_db)):
+async def obtener_evento(
+    evento_id: int,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """
     Retorna la información de un evento específico por su ID.
 
@@ -61,6 +91,7 @@ async def obtener_evento(evento_id: int, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=EVENTO_NO_ENCONTRADO
         )
+    response.headers["Cache-Control"] = CACHE_CONTROL_PUBLICO
     return evento
 
 @router.post("/", response_model=EventoOut, status_code=status.HTTP_201_CREATED, summary="Crear un nuevo evento")
@@ -84,17 +115,9 @@ async def crear_evento(
 
     Raises:
         HTTPException: 400 si ya existe un evento con ese nombre.
-                      500 si ocurre un error inesperado.
     """
-
-    # Validar que no exista un evento con el mismo nombre
-    existente = await crud_eventos.get_by_nombre(db, evento_in.nombre_evento)
-    if existente:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=EVENTO_DUPLICADO
-        )
-
+    # La unicidad del nombre (sin distinguir mayúsculas) la resuelve el INSERT ... ON CONFLICT
+    # sobre el índice uq_eventos_nombre_lower: no se consulta antes de insertar
     try:
         # Crear el evento usando el método del CRUD
         nuevo_evento = await crud_eventos.create_evento(
@@ -102,20 +125,18 @@ async def crear_evento(
             evento_in.nombre_evento,
             evento_in.tipo_login
         )
-        return nuevo_evento
-
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Datos inválidos: {str(e)}"
         ) from e
 
-    except Exception as e:
-        logger.error("Error al crear evento: %s", str(e))
+    if nuevo_evento is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error interno al crear el evento."
-        ) from e
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=EVENTO_DUPLICADO
+        )
+    return nuevo_evento
 
 @router.delete("/{evento_id}", summary="Eliminar un evento", status_code=status.HTTP_204_NO_CONTENT)
 async def eliminar_evento(evento_id: int, db: AsyncSession = Depends(get_db)):
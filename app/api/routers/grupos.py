@@ -11,7 +11,7 @@ Incluye operaciones CRUD:
 - Eliminar un grupo
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,28 +28,71 @@ EVENTO_NO_ENCONTRADO = "Evento no encontrado"
 GRUPO_NOMBRE_DUPLICADO = "Ya existe un grupo con ese nombre en el evento"
 GRUPO_NOMBRE_VACIO = "El nombre del grupo no puede estar vacío"
 FECHA_CIERRE_INVALIDA = "La fecha de cierre debe ser posterior a la fecha de inicio"
+CURSOR_INCOMPLETO = "cursor_fecha y cursor_id deben enviarse juntos"
+
+# Paginación de los listados
+LIMITE_POR_DEFECTO = 100
+LIMITE_MAXIMO = 1000
+
+async def _cursor_grupos(
+    cursor_fecha: Optional[datetime] = Query(
+        None, description="fecha_inicio del último grupo recibido (paginación por cursor)"
+    ),
+    cursor_id: Optional[int] = Query(
+        None, description="id_grupo del último grupo recibido (paginación por cursor)"
+    )
+) -> Optional[Tuple[datetime, int]]:
+    """
+    Dependencia que arma el cursor (fecha_inicio, id_grupo) de los listados de grupos.
+
+    Con cursor, la página siguiente se obtiene con una búsqueda en el índice en lugar de
+    OFFSET, cuyo costo crece con la profundidad de la página.
+
+    Raises:
+        HTTPException: 400 si solo se envía uno de los dos parámetros.
+    """
+    if cursor_fecha is None and cursor_id is None:
+        return None
+    if cursor_fecha is None or cursor_id is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=CURSOR_INCOMPLETO)
+    return cursor_fecha, cursor_id
 
 @router.get("/", response_model=List[GrupoOut])
-async def listar_grupos(db: AsyncSession = Depends(get_db)):
-    """Retorna una lista de todos los grupos registrados."""
-    return await crud_grupos.get_grupos(db)
+async def listar_grupos(
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    offset: int = Query(0, ge=0),
+    despues: Optional[Tuple[datetime, int]] = Depends(_cursor_grupos),
+    db: AsyncSession = Depends(get_db)
+):
+    """Retorna una página de los grupos registrados (por offset o por cursor)."""
+    return await crud_grupos.get_grupos(db, limit, offset, despues)
 
 @router.get("/evento/{evento_id}", response_model=List[GrupoOut])
-async def listar_grupos_por_evento(evento_id: int, db: AsyncSession = Depends(get_db)):
-    """Retorna todos los grupos de un evento específico."""
-    evento = await crud_eventos.get_by_id(db, evento_id)
-    if not evento:
+async def listar_grupos_por_evento(
+    evento_id: int,
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    offset: int = Query(0, ge=0),
+    despues: Optional[Tuple[datetime, int]] = Depends(_cursor_grupos),
+    db: AsyncSession = Depends(get_db)
+):
+    """Retorna una página de los grupos de un evento específico (por offset o por cursor)."""
+    grupos = await crud_grupos.get_grupos_by_evento(db, evento_id, limit, offset, despues)
+    # Si hay grupos el evento existe (FK); solo una página vacía requiere verificarlo
+    if not grupos and not await crud_eventos.evento_existe(db, evento_id):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=EVENTO_NO_ENCONTRADO)
-    return await crud_grupos.get_grupos_by_evento(db, evento_id)
+    return grupos
 
 @router.get("/activos", response_model=List[GrupoOut])
 async def listar_grupos_activos(
     fecha: Optional[datetime] = Query(None, description="Fecha para verificar grupos activos"),
     evento_id: Optional[int] = Query(None, description="ID del evento para filtrar grupos"),
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    offset: int = Query(0, ge=0),
+    despues: Optional[Tuple[datetime, int]] = Depends(_cursor_grupos),
     db: AsyncSession = Depends(get_db)
 ):
-    """Retorna todos los grupos activos en una fecha específica."""
-    return await crud_grupos.get_grupos_activos(db, fecha, evento_id)
+    """Retorna una página de los grupos activos en una fecha específica (por offset o por cursor)."""
+    return await crud_grupos.get_grupos_activos(db, fecha, evento_id, limit, offset, despues)
 
 @router.get("/{grupo_id}", response_model=GrupoOut)
 async def obtener_grupo(grupo_id: int, db: AsyncSession = Depends(get_db)):
@@ -62,11 +105,10 @@ async def obtener_grupo(grupo_id: int, db: AsyncSession = Depends(get_db)):
 @router.post("/", response_model=GrupoOut, status_code=status.HTTP_201_CREATED)
 async def crear_grupo(grupo: GrupoCreate, db: AsyncSession = Depends(get_db)):
     """Crea un nuevo grupo en un evento."""
-    evento = await crud_eventos.get_by_id(db, grupo.id_evento)
-    if not evento:
+    if not await crud_eventos.evento_existe(db, grupo.id_evento):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=EVENTO_NO_ENCONTRADO)
     try:
-        return await crud_grupos.create_grupo(
+        nuevo = await crud_grupos.create_grupo(
             db,
             grupo.id_evento,
             grupo.nombre_grupo,
@@ -77,6 +119,10 @@ async def crear_grupo(grupo: GrupoCreate, db: AsyncSession = Depends(get_db)):
         )
     except IntegrityError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=GRUPO_NOMBRE_DUPLICADO) from exc
+    # ON CONFLICT DO NOTHING: sin fila creada el nombre ya existe en el evento
+    if nuevo is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=GRUPO_NOMBRE_DUPLICADO)
+    return nuevo
 
 @router.put("/{grupo_id}", response_model=GrupoOut)
 async def actualizar_grupo_endpoint(
@@ -1,12 +1,32 @@
 from typing import List
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.connection import get_db
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from app.db.connection import get_db, get_read_session_factory
 from app.services import informes
 from app.schemas.informes import RankingUsuarioOut
 
 router = APIRouter(prefix="/informes", tags=["Informes"])
 
+# Serializador compilado una vez para el ranking; las filas ya vienen con los tipos del
+# esquema (`model_construct`), así que solo se vuelcan a JSON sin volver a validarlas
+_RANKING_ADAPTER = TypeAdapter(RankingUsuarioOut)
+
+async def _ranking_json(session_factory: async_sessionmaker, grupo_id: int, numero_intento: int):
+    """
+    Genera el ranking como un arreglo JSON, posición por posición.
+
+    La sesión se abre dentro del generador porque debe seguir viva mientras se envía la
+    respuesta; en memoria solo hay un lote de filas a la vez.
+    """
+    async with session_factory() as db:
+        separador = b"["
+        async for posicion in informes.iter_ranking_usuarios(db, grupo_id, numero_intento):
+            yield separador + _RANKING_ADAPTER.dump_json(posicion)
+            separador = b","
+        yield b"]" if separador == b"," else b"[]"
+
 @router.get("/pendientes")
 async def listar_pendientes(db: AsyncSession = Depends(get_db)):
     return await informes.usuarios_pendientes(db)
@@ -25,7 +45,7 @@ async def listar_finalizados(db: AsyncSession = Depends(get_db)):
 async def obtener_ranking(
     grupo_id: int = Query(None, description="ID del grupo al que pertenecen los usuarios"),
     numero_intento: int = Query(None, description="Número del intento realizado por los usuarios"),
-    db: AsyncSession = Depends(get_db)
+    session_factory: async_sessionmaker = Depends(get_read_session_factory)
 ):
     """
     Retorna un ranking ordenado de usuarios que han finalizado la trivia.
@@ -34,6 +54,10 @@ async def obtener_ranking(
     - Luego por `tiempo_total` (ascendente)
     - Permite filtrar por `grupo_id` y `numero_intento`
 
+    La respuesta se transmite por partes, así el ranking completo no se materializa en memoria.
     Esta información es útil para informes y visualización de resultados.
     """
-    return await informes.ranking_usuarios(db, grupo_id, numero_intento)
+    return StreamingResponse(
+        _ranking_json(session_factory, grupo_id, numero_intento),
+        media_type="application/json"
+    )
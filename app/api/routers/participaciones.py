@@ -11,24 +11,42 @@ en eventos de trivia, incluyendo:
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.db.connection import get_db
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from app.db.connection import get_session_factory, get_read_session_factory
 from app.services import participacion
 from app.schemas.participacion import (
     GestionarParticipacionRequest,
     FinalizarParticipacionRequest,
     ParticipacionResponse,
-    ListarParticipacionesResponse
+    ListarParticipacionesResponse,
+    RESPUESTAS_ADAPTER
 )
 from app.models.participacion import EstadoParticipacion
 from app.core.auth import crear_token, verificar_token
 
-from app.core.logger import MyLogger
-logger = MyLogger().get_logger()
+NO_AUTORIZADO_PARTICIPACION = "No autorizado para actualizar esta participación"
 
 router = APIRouter(prefix="/participaciones", tags=["Participaciones"])
 
+# Paginación de los listados
+LIMITE_POR_DEFECTO = 50
+LIMITE_MAXIMO = 200
+
+# Serializador del listado, construido una sola vez al importar
+_LISTADO_ADAPTER = TypeAdapter(ListarParticipacionesResponse)
+
+def _listado_json(respuesta: ListarParticipacionesResponse) -> Response:
+    """
+    Serializa un listado ya validado directamente a bytes JSON con pydantic-core.
+
+    Al devolver una `Response`, FastAPI omite volver a volcar y validar el modelo contra
+    `response_model`, que se conserva solo para documentar el esquema en Swagger. Tampoco
+    se construye el diccionario intermedio que requería `model_dump` + orjson.
+    """
+    return Response(_LISTADO_ADAPTER.dump_json(respuesta), media_type="application/json")
+
 @router.post(
     "/loginU",
     response_model=ParticipacionResponse,
@@ -37,30 +55,19 @@ router = APIRouter(prefix="/participaciones", tags=["Participaciones"])
 )
 async def gestionar_participante(
     data: GestionarParticipacionRequest,
-    db: AsyncSession = Depends(get_db)
+    session_factory: async_sessionmaker = Depends(get_session_factory)
 ):
     """
     Llama a la capa de CRUD para crear, continuar o finalizar
     una participación sin duplicar validaciones en el router.
     """
-    try:
+    async with session_factory() as db:
         result = await participacion.gestionar_participacion(
             db,
             nombre=data.nombre,
             cedula=data.cedula,
             grupo_id=data.grupo_id
         )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.exception(
-            "Error inesperado al gestionar participación (grupo=%s)",
-            data.grupo_id
-        )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error interno al gestionar la participación"
-        ) from e
 
     token = crear_token({
         "cedula":            data.cedula,
@@ -88,7 +95,7 @@ async def gestionar_participante(
 )
 async def finalizar(
     data: FinalizarParticipacionRequest,
-    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_session_factory),
     usuario: dict = Depends(verificar_token)
 ):
     """
@@ -96,31 +103,26 @@ async def finalizar(
 
     Args:
         data: Datos de finalización incluyendo respuestas y tiempo
-        db: Sesión de base de datos
+        session_factory: Fábrica de sesiones de base de datos
 
     Raises:
-        HTTPException: 500 si hay error al finalizar la participación
+        HTTPException: 403 si el token no corresponde a la participación,
+            404 si no existe y 400 si ya está finalizada
     """
     # Validar que el token corresponda al evento solicitado
     if usuario["id_participacion"] != data.id_participacion:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="No autorizado para actualizar esta participación"
+            detail=NO_AUTORIZADO_PARTICIPACION
         )
-    
-    try:
-        resultado = await participacion.finalizar_participacion(
+
+    async with session_factory() as db:
+        return await participacion.finalizar_participacion(
             db,
             data.id_participacion,
-            [resp.model_dump() for resp in data.respuestas],
-            data.tiempo
+            RESPUESTAS_ADAPTER.dump_python(data.respuestas),
+            data.duracion
         )
-        return resultado
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error al finalizar la participación: {str(e)}"
-        ) from e
 
 @router.delete(
     "/{id_participacion}",
@@ -129,19 +131,20 @@ async def finalizar(
 )
 async def eliminar(
     id_participacion: int,
-    db: AsyncSession = Depends(get_db)
+    session_factory: async_sessionmaker = Depends(get_session_factory)
 ):
     """
     Elimina una participación y todos sus datos relacionados.
 
     Args:
         id_participacion: ID de la participación a eliminar
-        db: Sesión de base de datos
+        session_factory: Fábrica de sesiones de base de datos
 
     Raises:
         HTTPException: 404 si la participación no existe
     """
-    await participacion.eliminar_participacion(db, id_participacion)
+    async with session_factory() as db:
+        await participacion.eliminar_participacion(db, id_participacion)
 
 @router.get(
     "/estado/{estado}",
@@ -152,7 +155,9 @@ async def listar_por_estado(
     estado: EstadoParticipacion,
     id_evento: Optional[int] = None,
     id_grupo: Optional[int] = None,
-    db: AsyncSession = Depends(get_db)
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO, description="Máximo de participaciones a devolver"),
+    offset: int = Query(0, ge=0, description="Número de participaciones a omitir"),
+    session_factory: async_sessionmaker = Depends(get_read_session_factory)
 ):
     """
     Obtiene todas las participaciones que tienen un estado específico,
@@ -162,18 +167,24 @@ async def listar_por_estado(
         estado: Estado de las participaciones a buscar (pendiente o finalizado)
         id_evento (Optional[int]): ID del evento para filtrar
         id_grupo (Optional[int]): ID del grupo para filtrar
-        db: Sesión de base de datos
+        limit (int): Máximo de participaciones a devolver (1-200)
+        offset (int): Número de participaciones a omitir
+        session_factory: Fábrica de sesiones de base de datos
 
     Returns:
         ListarParticipacionesResponse: Lista de participaciones y total
     """
-    participaciones = await participacion.get_participaciones_por_estado(
-        db, estado, id_evento=id_evento, id_grupo=id_grupo
-    )
-    return ListarParticipacionesResponse(
-        participaciones=participaciones,
-        total=len(participaciones)
-    )
+    async with session_factory() as db:
+        participaciones, total = await participacion.get_participaciones_por_estado(
+            db, estado, id_evento=id_evento, id_grupo=id_grupo, limit=limit, offset=offset
+        )
+        respuesta = ListarParticipacionesResponse(
+            participaciones=participaciones,
+            total=total,
+            limit=limit,
+            offset=offset
+        )
+    return _listado_json(respuesta)
 
 @router.get(
     "/buscar",
@@ -184,7 +195,9 @@ async def buscar_participaciones(
     cedula: Optional[str] = None,
     id_evento: Optional[int] = None,
     id_grupo: Optional[int] = None,
-    db: AsyncSession = Depends(get_db)
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO, description="Máximo de participaciones a devolver"),
+    offset: int = Query(0, ge=0, description="Número de participaciones a omitir"),
+    session_factory: async_sessionmaker = Depends(get_read_session_factory)
 ):
     """
     Busca participaciones filtrando por cédula del usuario, evento y/o grupo.
@@ -193,7 +206,9 @@ async def buscar_participaciones(
         cedula (Optional[str]): Cédula del usuario para filtrar
         id_evento (Optional[int]): ID del evento para filtrar
         id_grupo (Optional[int]): ID del grupo para filtrar
-        db (AsyncSession): Sesión de base de datos
+        limit (int): Máximo de participaciones a devolver (1-200)
+        offset (int): Número de participaciones a omitir
+        session_factory (async_sessionmaker): Fábrica de sesiones de base de datos
 
     Returns:
         ListarParticipacionesResponse: Lista de participaciones que coinciden con los filtros y total
@@ -201,16 +216,22 @@ async def buscar_participaciones(
     Raises:
         HTTPException: 400 si no se proporciona ningún filtro
     """
-    participaciones = await participacion.get_participaciones_por_usuario_evento(
-        db,
-        cedula=cedula,
-        id_evento=id_evento,
-        id_grupo=id_grupo
-    )
-    return ListarParticipacionesResponse(
-        participaciones=participaciones,
-        total=len(participaciones)
-    )
+    async with session_factory() as db:
+        participaciones, total = await participacion.get_participaciones_por_usuario_evento(
+            db,
+            cedula=cedula,
+            id_evento=id_evento,
+            id_grupo=id_grupo,
+            limit=limit,
+            offset=offset
+        )
+        respuesta = ListarParticipacionesResponse(
+            participaciones=participaciones,
+            total=total,
+            limit=limit,
+            offset=offset
+        )
+    return _listado_json(respuesta)
 
 @router.get(
     "/",
@@ -218,22 +239,32 @@ async def buscar_participaciones(
     summary="Listar todas las participaciones"
 )
 async def listar_participaciones(
-    db: AsyncSession = Depends(get_db)
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO, description="Máximo de participaciones a devolver"),
+    offset: int = Query(0, ge=0, description="Número de participaciones a omitir"),
+    session_factory: async_sessionmaker = Depends(get_read_session_factory)
 ):
     """
-    Obtiene todas las participaciones registradas.
+    Obtiene las participaciones registradas de forma paginada.
 
     Args:
-        db: Sesión de base de datos
+        limit (int): Máximo de participaciones a devolver (1-200)
+        offset (int): Número de participaciones a omitir
+        session_factory: Fábrica de sesiones de base de datos
 
     Returns:
         ListarParticipacionesResponse: Lista de todas las participaciones y total
     """
-    participaciones = await participacion.get_all_participaciones(db)
-    return ListarParticipacionesResponse(
-        participaciones=participaciones,
-        total=len(participaciones)
-    )
+    async with session_factory() as db:
+        participaciones, total = await participacion.get_all_participaciones(
+            db, limit=limit, offset=offset
+        )
+        respuesta = ListarParticipacionesResponse(
+            participaciones=participaciones,
+            total=total,
+            limit=limit,
+            offset=offset
+        )
+    return _listado_json(respuesta)
 
 @router.get(
     "/grupo/{id_grupo}",
@@ -242,14 +273,18 @@ async def listar_participaciones(
 )
 async def listar_por_grupo(
     id_grupo: int,
-    db: AsyncSession = Depends(get_db)
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO, description="Máximo de participaciones a devolver"),
+    offset: int = Query(0, ge=0, description="Número de participaciones a omitir"),
+    session_factory: async_sessionmaker = Depends(get_read_session_factory)
 ):
     """
     Obtiene todas las participaciones de un grupo específico.
 
     Args:
         id_grupo (int): ID del grupo para filtrar
-        db (AsyncSession): Sesión de base de datos
+        limit (int): Máximo de participaciones a devolver (1-200)
+        offset (int): Número de participaciones a omitir
+        session_factory (async_sessionmaker): Fábrica de sesiones de base de datos
 
     Returns:
         ListarParticipacionesResponse: Lista de participaciones del grupo y total
@@ -257,8 +292,14 @@ async def listar_por_grupo(
     Raises:
         HTTPException: 404 si el grupo no existe
     """
-    participaciones = await participacion.get_participaciones_por_grupo(db, id_grupo)
-    return ListarParticipacionesResponse(
-        participaciones=participaciones,
-        total=len(participaciones)
-    )
+    async with session_factory() as db:
+        participaciones, total = await participacion.get_participaciones_por_grupo(
+            db, id_grupo, limit=limit, offset=offset
+        )
+        respuesta = ListarParticipacionesResponse(
+            participaciones=participaciones,
+            total=total,
+            limit=limit,
+            offset=offset
+        )
+    return _listado_json(respuesta)
@@ -14,32 +14,57 @@ Las respuestas están documentadas automáticamente en Swagger (/docs).
 
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.exc import IntegrityError
 
-from app.db.connection import get_db
+from app.db.connection import get_session_factory, get_read_session_factory
 from app.crud import crud_preguntas
 from app.crud import crud_secciones
 from app.crud import crud_eventos
-from app.schemas.pregunta import PreguntaCreate, PreguntaOut, RespuestaCreate
+from app.schemas.pregunta import PreguntaCreate, PreguntaOut, RespuestaCreate, ordenes_consecutivos
 from app.core.auth import verificar_token
 
 PREGUNTA_NO_ENCONTRADA = "Pregunta no encontrada"
+SECCION_NO_ENCONTRADA = "Sección no encontrada"
+PREGUNTA_DUPLICADA = "Ya existe una pregunta con el mismo texto en esta sección"
 
 router = APIRouter(prefix="/preguntas", tags=["Preguntas"])
 
+# Validador/serializador compilado una vez para el listado transmitido por partes
+_PREGUNTA_ADAPTER = TypeAdapter(PreguntaOut)
+
+async def _preguntas_json(session_factory: async_sessionmaker):
+    """
+    Genera el listado completo de preguntas como un arreglo JSON, pregunta por pregunta.
+
+    La sesión se abre dentro del generador porque debe seguir viva mientras se envía la
+    respuesta; en memoria solo hay un lote de preguntas a la vez.
+    """
+    async with session_factory() as db:
+        separador = b"["
+        async for pregunta in crud_preguntas.iter_preguntas(db):
+            datos = _PREGUNTA_ADAPTER.validate_python(pregunta, from_attributes=True)
+            yield separador + _PREGUNTA_ADAPTER.dump_json(datos)
+            separador = b","
+        yield b"]" if separador == b"," else b"[]"
+
 @router.get("/", response_model=List[PreguntaOut])
-async def listar_preguntas(db: AsyncSession = Depends(get_db)):
+async def listar_preguntas(session_factory: async_sessionmaker = Depends(get_read_session_factory)):
     """
     Retorna una lista de todas las preguntas registradas.
 
+    La respuesta se transmite por partes (sin ETag), así el listado completo no se
+    materializa en memoria.
+
     Returns:
         List[PreguntaOut]: Lista de preguntas disponibles.
     """
-    return await crud_preguntas.get_preguntas(db)
+    return StreamingResponse(_preguntas_json(session_factory), media_type="application/json")
 
 @router.get("/seccion/{seccion_id}", response_model=List[PreguntaOut])
-async def listar_preguntas_por_seccion(seccion_id: int, db: AsyncSession = Depends(get_db)):
+async def listar_preguntas_por_seccion(seccion_id: int, session_factory: async_sessionmaker = Depends(get_read_session_factory)):
     """
     Retorna todas las preguntas de una sección específica.
 
@@ -52,13 +77,14 @@ async def listar_preguntas_por_seccion(seccion_id: int, db: AsyncSession = Depen
     Raises:
         HTTPException: 404 si la sección no existe.
     """
-    seccion = await crud_secciones.get_seccion(db, seccion_id)
-    if not seccion:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sección no encontrada"
-        )
-    return await crud_preguntas.get_preguntas_by_seccion(db, seccion_id)
+    async with session_factory() as db:
+        seccion = await crud_secciones.get_seccion(db, seccion_id)
+        if not seccion:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=SECCION_NO_ENCONTRADA
+            )
+        return await crud_preguntas.get_preguntas_by_seccion(db, seccion_id)
 
 @router.get(
     "/evento/{evento_id}",
@@ -69,7 +95,7 @@ async def listar_preguntas_por_seccion(seccion_id: int, db: AsyncSession = Depen
 )
 async def listar_preguntas_por_evento(
     evento_id: int,
-    db: AsyncSession = Depends(get_db),
+    session_factory: async_sessionmaker = Depends(get_read_session_factory),
     usuario: dict = Depends(verificar_token)
 ):
     """
@@ -80,7 +106,7 @@ async def listar_preguntas_por_evento(
 
     Args:
         evento_id (int): ID del evento del que se desean obtener las preguntas.
-        db (AsyncSession): Sesión de base de datos inyectada.
+        session_factory (async_sessionmaker): Fábrica de sesiones de base de datos.
         usuario (dict): Información extraída del token JWT.
 
     Returns:
@@ -99,20 +125,20 @@ async def listar_preguntas_por_evento(
             detail="No autorizado para acceder a este evento"
         )
 
-    # Validar que el evento exista en la base de datos
-    evento = await crud_eventos.get_by_id(db, evento_id)
-    if not evento:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Evento con ID {evento_id} no encontrado"
-        )
+    async with session_factory() as db:
+        # Validar que el evento exista en la base de datos
+        if not await crud_eventos.evento_existe(db, evento_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Evento con ID {evento_id} no encontrado"
+            )
 
-    # Obtener preguntas asociadas al evento
-    preguntas = await crud_preguntas.get_preguntas_by_evento(db, evento_id)
-    return preguntas
+        # Obtener preguntas asociadas al evento
+        preguntas = await crud_preguntas.get_preguntas_by_evento(db, evento_id)
+        return preguntas
 
 @router.get("/{pregunta_id}", response_model=PreguntaOut)
-async def obtener_pregunta(pregunta_id: int, db: AsyncSession = Depends(get_db)):
+async def obtener_pregunta(pregunta_id: int, session_factory: async_sessionmaker = Depends(get_read_session_factory)):
     """
     Retorna la información de una pregunta específica.
 
@@ -125,16 +151,17 @@ async def obtener_pregunta(pregunta_id: int, db: AsyncSession = Depends(get_db))
     Raises:
         HTTPException: 404 si la pregunta no existe.
     """
-    pregunta = await crud_preguntas.get_pregunta(db, pregunta_id)
-    if not pregunta:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=PREGUNTA_NO_ENCONTRADA
-        )
-    return pregunta
+    async with session_factory() as db:
+        pregunta = await crud_preguntas.get_pregunta(db, pregunta_id)
+        if not pregunta:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=PREGUNTA_NO_ENCONTRADA
+            )
+        return pregunta
 
 @router.post("/", response_model=PreguntaOut, status_code=status.HTTP_201_CREATED)
-async def crear_pregunta(pregunta: PreguntaCreate, db: AsyncSession = Depends(get_db)):
+async def crear_pregunta(pregunta: PreguntaCreate, session_factory: async_sessionmaker = Depends(get_session_factory)):
     """
     Crea una nueva pregunta en una sección con sus respuestas.
 
@@ -149,36 +176,37 @@ async def crear_pregunta(pregunta: PreguntaCreate, db: AsyncSession = Depends(ge
             - 404 si la sección no existe.
             - 400 si ya existe una pregunta con el mismo texto en la sección.
     """
-    # Verificar que la sección existe
-    seccion = await crud_secciones.get_seccion(db, pregunta.id_seccion)
-    if not seccion:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Sección no encontrada"
-        )
+    async with session_factory() as db:
+        # Verificar que la sección existe
+        seccion = await crud_secciones.get_seccion(db, pregunta.id_seccion)
+        if not seccion:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=SECCION_NO_ENCONTRADA
+            )
 
-    # Validación adicional por tipo de pregunta
-    if pregunta.tipo_pregunta == "abierta":
-        respuestas = None
-        opcion_correcta = None
-    else:
-        respuestas = pregunta.respuestas
-        opcion_correcta = pregunta.opcion_correcta
-
-    try:
-        return await crud_preguntas.create_pregunta(
-            db,
-            pregunta.id_seccion,
-            pregunta.pregunta,
-            pregunta.tipo_pregunta,
-            respuestas,
-            opcion_correcta
-        )
-    except IntegrityError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Ya existe una pregunta con el mismo texto en esta sección"
-        ) from exc
+        # Validación adicional por tipo de pregunta
+        if pregunta.tipo_pregunta == "abierta":
+            respuestas = None
+            opcion_correcta = None
+        else:
+            respuestas = pregunta.respuestas
+            opcion_correcta = pregunta.opcion_correcta
+
+        try:
+            return await crud_preguntas.create_pregunta(
+                db,
+                pregunta.id_seccion,
+                pregunta.pregunta,
+                pregunta.tipo_pregunta,
+                respuestas,
+                opcion_correcta
+            )
+        except IntegrityError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=PREGUNTA_DUPLICADA
+            ) from exc
 
 @router.put("/{pregunta_id}", response_model=PreguntaOut)
 async def actualizar_pregunta(
@@ -186,7 +214,7 @@ async def actualizar_pregunta(
     pregunta: Optional[str] = None,
     opcion_correcta: Optional[int] = None,
     respuestas: Optional[List[RespuestaCreate]] = None,
-    db: AsyncSession = Depends(get_db)
+    session_factory: async_sessionmaker = Depends(get_session_factory)
 ):
     """
     Actualiza una pregunta existente y sus respuestas.
@@ -207,73 +235,74 @@ async def actualizar_pregunta(
             - 400 si la opción correcta no es válida.
             - 400 si las respuestas no tienen órdenes consecutivos.
     """
-    # Obtener la pregunta existente
-    pregunta_db = await crud_preguntas.get_pregunta(db, pregunta_id)
-    if not pregunta_db:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=PREGUNTA_NO_ENCONTRADA
-        )
-
-    # Validar y actualizar el texto de la pregunta
-    if pregunta is not None:
-        pregunta = pregunta.strip()
-        if not pregunta:
+    async with session_factory() as db:
+        # Obtener la pregunta existente
+        pregunta_db = await crud_preguntas.get_pregunta(db, pregunta_id)
+        if not pregunta_db:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="La pregunta no puede estar vacía"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=PREGUNTA_NO_ENCONTRADA
             )
 
-    # Determinar tipo de pregunta
-    tipo_pregunta = getattr(pregunta_db, "tipo_pregunta", None)
+        # Validar y actualizar el texto de la pregunta
+        if pregunta is not None:
+            pregunta = pregunta.strip()
+            if not pregunta:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="La pregunta no puede estar vacía"
+                )
 
-    # Validar y actualizar según tipo
-    if tipo_pregunta == "abierta":
-        if respuestas is not None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Las preguntas abiertas no deben tener respuestas"
-            )
-        if opcion_correcta is not None:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Las preguntas abiertas no deben tener opción correcta"
-            )
-    elif tipo_pregunta == "opcion_unica":
-        if respuestas is not None:
-            ordenes = [r.orden for r in respuestas]
-            if sorted(ordenes) != list(range(1, len(respuestas) + 1)):
+        # Determinar tipo de pregunta
+        tipo_pregunta = getattr(pregunta_db, "tipo_pregunta", None)
+
+        # Validar y actualizar según tipo
+        if tipo_pregunta == "abierta":
+            if respuestas is not None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Los órdenes de las respuestas deben ser números consecutivos empezando desde 1"
+                    detail="Las preguntas abiertas no deben tener respuestas"
                 )
-            if opcion_correcta is not None and opcion_correcta not in ordenes:
+            if opcion_correcta is not None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="La opción correcta debe corresponder al orden de una de las respuestas"
+                    detail="Las preguntas abiertas no deben tener opción correcta"
                 )
-
-    # Actualizar la pregunta con sus respuestas en la base de datos
-    try:
-        kwargs = {
-            "opcion_correcta": opcion_correcta,
-            "respuestas": respuestas
-        }
-        if pregunta is not None:
-            kwargs["pregunta"] = pregunta
-        return await crud_preguntas.update_pregunta(
-            db,
-            pregunta_id,
-            **kwargs
-        )
-    except IntegrityError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Ya existe una pregunta con el mismo texto en esta sección"
-        ) from exc
+        elif tipo_pregunta == "opcion_unica":
+            if respuestas is not None:
+                if not ordenes_consecutivos(respuestas, len(respuestas)):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Los órdenes de las respuestas deben ser números consecutivos empezando desde 1"
+                    )
+                # Con órdenes 1..n, la opción es válida si está en ese rango
+                if opcion_correcta is not None and not 1 <= opcion_correcta <= len(respuestas):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="La opción correcta debe corresponder al orden de una de las respuestas"
+                    )
+
+        # Actualizar la pregunta con sus respuestas en la base de datos
+        try:
+            kwargs = {
+                "opcion_correcta": opcion_correcta,
+                "respuestas": respuestas
+            }
+            if pregunta is not None:
+                kwargs["pregunta"] = pregunta
+            return await crud_preguntas.update_pregunta(
+                db,
+                pregunta_id,
+                **kwargs
+            )
+        except IntegrityError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=PREGUNTA_DUPLICADA
+            ) from exc
 
 @router.delete("/{pregunta_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def eliminar_pregunta(pregunta_id: int, db: AsyncSession = Depends(get_db)):
+async def eliminar_pregunta(pregunta_id: int, session_factory: async_sessionmaker = Depends(get_session_factory)):
     """
     Elimina una pregunta por su ID.
 
@@ -283,11 +312,9 @@ async def eliminar_pregunta(pregunta_id: int, db: AsyncSession = Depends(get_db)
     Raises:
         HTTPException: 404 si la pregunta no existe.
     """
-    pregunta = await crud_preguntas.get_pregunta(db, pregunta_id)
-    if not pregunta:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=PREGUNTA_NO_ENCONTRADA
-        )
-    
-    await crud_preguntas.delete_pregunta(db, pregunta)
\ No newline at end of file
+    async with session_factory() as db:
+        if not await crud_preguntas.delete_pregunta(db, pregunta_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=PREGUNTA_NO_ENCONTRADA
+            )
\ No newline at end of file
@@ -4,6 +4,7 @@ Módulo de rutas para la gestión de secciones.
 Incluye operaciones CRUD:
 - Listar todas las secciones
 - Listar secciones por evento
+- Listar secciones de varios eventos en una sola llamada
 - Obtener una sección por ID
 - Crear una nueva sección
 - Actualizar una sección existente
@@ -12,35 +13,79 @@ Incluye operaciones CRUD:
 Las respuestas están documentadas automáticamente en Swagger (/docs).
 """
 
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Dict, List
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from app.core.config import CACHE_CONTROL_PUBLICO
 from app.db.connection import get_db
 from app.crud import crud_eventos, crud_secciones
-from app.schemas.seccion import SeccionCreate, SeccionOut
+from app.schemas.seccion import SeccionCreate, SeccionOut, formatear_titulo
 
 SECCION_NO_ENCONTRADA = "Sección no encontrada"
+EVENTO_NO_ENCONTRADO = "Evento no encontrado"
+SECCION_DUPLICADA = "Ya existe una sección con ese nombre en el evento"
+
+# SQLSTATE de PostgreSQL para violación de llave foránea
+FOREIGN_KEY_VIOLATION = "23503"
+
+# Paginación de los listados
+LIMITE_POR_DEFECTO = 100
+LIMITE_MAXIMO = 1000
+LIMITE_EVENTOS_BATCH = 100
+
+# Validador/serializador compilado una vez para el listado de secciones
+_SECCIONES_ADAPTER = TypeAdapter(List[SeccionOut])
+
+def _secciones_json(filas) -> Response:
+    """
+    Valida las filas del listado y las serializa a JSON en una sola pasada de pydantic-core.
+
+    Al devolver una `Response`, FastAPI no repite la validación contra `response_model`,
+    que se conserva solo para documentar el esquema en Swagger.
+    """
+    datos = _SECCIONES_ADAPTER.validate_python(filas, from_attributes=True)
+    return Response(
+        _SECCIONES_ADAPTER.dump_json(datos),
+        media_type="application/json",
+        headers={"Cache-Control": CACHE_CONTROL_PUBLICO}
+    )
 
 router = APIRouter(prefix="/secciones", tags=["Secciones"])
 
 @router.get("/", response_model=List[SeccionOut])
-async def listar_secciones(db: AsyncSession = Depends(get_db)):
+async def listar_secciones(
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    Retorna una lista de todas las secciones registradas.
+    Retorna una página de las secciones registradas.
+
+    Args:
+        limit (int): Máximo de secciones a retornar.
+        offset (int): Secciones a omitir.
 
     Returns:
         List[SeccionOut]: Lista de secciones disponibles.
     """
-    return await crud_secciones.get_secciones(db)
+    return _secciones_json(await crud_secciones.get_secciones(db, limit, offset))
 
 @router.get("/evento/{evento_id}", response_model=List[SeccionOut])
-async def listar_secciones_por_evento(evento_id: int, db: AsyncSession = Depends(get_db)):
+async def listar_secciones_por_evento(
+    evento_id: int,
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    Retorna todas las secciones de un evento específico.
+    Retorna una página de las secciones de un evento específico.
 
     Args:
         evento_id (int): ID del evento.
+        limit (int): Máximo de secciones a retornar.
+        offset (int): Secciones a omitir.
 
     Returns:
         List[SeccionOut]: Lista de secciones del evento.
@@ -48,16 +93,55 @@ async def listar_secciones_por_evento(evento_id: int, db: AsyncSession = Depends
     Raises:
         HTTPException: 404 si el evento no existe.
     """
-    evento = await crud_eventos.get_by_id(db, evento_id)
-    if not evento:
+    secciones = await crud_secciones.get_secciones_by_evento(db, evento_id, limit, offset)
+    # Si hay secciones el evento existe (FK); solo una página vacía requiere verificarlo
+    if not secciones and not await crud_eventos.evento_existe(db, evento_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Evento no encontrado"
+            detail=EVENTO_NO_ENCONTRADO
         )
-    return await crud_secciones.get_secciones_by_evento(db, evento_id)
+    return _secciones_json(secciones)
+
+@router.get("/batch", response_model=Dict[int, List[SeccionOut]])
+async def listar_secciones_por_eventos(
+    response: Response,
+    evento_ids: List[int] = Query(..., min_length=1, max_length=LIMITE_EVENTOS_BATCH),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Retorna las secciones de varios eventos en una sola llamada.
+
+    Evita que un cliente que muestra N eventos haga N llamadas a `/secciones/evento/{id}`:
+    las secciones se cargan con una consulta y solo los eventos sin secciones se verifican
+    (con otra consulta, o ninguna si están en caché).
+
+    Args:
+        evento_ids (List[int]): IDs de los eventos (`?evento_ids=1&evento_ids=2`).
+
+    Returns:
+        Dict[int, List[SeccionOut]]: Secciones agrupadas por ID de evento.
+
+    Raises:
+        HTTPException: 404 si alguno de los eventos no existe.
+    """
+    agrupadas = await crud_secciones.get_secciones_by_eventos(db, evento_ids)
+    sin_secciones = {id_evento for id_evento, secciones in agrupadas.items() if not secciones}
+    if sin_secciones:
+        faltantes = sin_secciones - await crud_eventos.get_eventos_existentes(db, sin_secciones)
+        if faltantes:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{EVENTO_NO_ENCONTRADO}: {sorted(faltantes)}"
+            )
+    response.headers["Cache-Control"] = CACHE_CONTROL_PUBLICO
+    return agrupadas
 
 @router.get("/{seccion_id}", response_model=SeccionOut)
-async def obtener_seccion(seccion_id: int, db: AsyncSession = Depends(get_db)):
+async def obtener_seccion(
+    seccion_id: int,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """
     Retorna la información de una sección específica.
 
@@ -76,6 +160,7 @@ async def obtener_seccion(seccion_id: int, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail=SECCION_NO_ENCONTRADA
         )
+    response.headers["Cache-Control"] = CACHE_CONTROL_PUBLICO
     return seccion
 
 @router.post("/", response_model=SeccionOut, status_code=status.HTTP_201_CREATED)
@@ -94,25 +179,34 @@ async def crear_seccion(seccion: SeccionCreate, db: AsyncSession = Depends(get_d
             - 404 si el evento no existe.
             - 400 si ya existe una sección con el mismo nombre en el evento.
     """
-    # Verificar que el evento existe
-    evento = await crud_eventos.get_by_id(db, seccion.id_evento)
-    if not evento:
+    # Verificar que el evento existe (caché en memoria, normalmente sin consulta)
+    if not await crud_eventos.evento_existe(db, seccion.id_evento):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Evento no encontrado"
+            detail=EVENTO_NO_ENCONTRADO
         )
     
     try:
-        return await crud_secciones.create_seccion(
+        nueva_seccion = await crud_secciones.create_seccion(
             db,
             seccion.id_evento,
             seccion.nombre_seccion
         )
     except IntegrityError as exc:
+        # El evento pudo eliminarse después de quedar en caché: la FK lo detecta en el INSERT
+        if getattr(exc.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=EVENTO_NO_ENCONTRADO
+            ) from exc
+        raise
+    # ON CONFLICT DO NOTHING: sin fila creada el nombre ya existe en el evento
+    if nueva_seccion is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Ya existe una sección con ese nombre en el evento"
-        ) from exc
+            detail=SECCION_DUPLICADA
+        )
+    return nueva_seccion
 
 @router.put("/{seccion_id}", response_model=SeccionOut)
 async def actualizar_seccion(
@@ -145,7 +239,7 @@ async def actualizar_seccion(
         )
     
     # Convertir a título
-    nombre_seccion = nombre_seccion.title()
+    nombre_seccion = formatear_titulo(nombre_seccion)
     
     try:
         seccion = await crud_secciones.update_seccion(db, seccion_id, nombre_seccion)
@@ -172,11 +266,8 @@ async def eliminar_seccion(seccion_id: int, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: 404 si la sección no existe.
     """
-    seccion = await crud_secciones.get_seccion(db, seccion_id)
-    if not seccion:
+    if not await crud_secciones.delete_seccion(db, seccion_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=SECCION_NO_ENCONTRADA
-        )
-    
-    await crud_secciones.delete_seccion(db, seccion)
\ No newline at end of file
+        )
\ No newline at end of file
@@ -10,24 +10,44 @@ Incluye operaciones CRUD:
 """
 
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError
 from app.db.connection import get_db
 from app.crud import crud_usuarios
 from app.schemas.usuario import UsuarioCreate, UsuarioOut
 
 router = APIRouter(prefix="/usuarios", tags=["Usuarios"])
 
+# Paginación de los listados
+LIMITE_POR_DEFECTO = 100
+LIMITE_MAXIMO = 1000
+
+# Validador/serializador compilado una vez para el listado de usuarios
+_USUARIOS_ADAPTER = TypeAdapter(List[UsuarioOut])
+
+def _usuarios_json(filas) -> Response:
+    """Convierte la página de usuarios en JSON con el adaptador precompilado (sin pasar por `response_model`)."""
+    datos = _USUARIOS_ADAPTER.validate_python(filas, from_attributes=True)
+    return Response(_USUARIOS_ADAPTER.dump_json(datos), media_type="application/json")
+
 @router.get("/", response_model=List[UsuarioOut])
-async def listar_usuarios(db: AsyncSession = Depends(get_db)):
+async def listar_usuarios(
+    limit: int = Query(LIMITE_POR_DEFECTO, ge=1, le=LIMITE_MAXIMO),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_db)
+):
     """
-    Retorna una lista de todos los usuarios registrados.
+    Retorna una página de los usuarios registrados.
+
+    Args:
+        limit (int): Máximo de usuarios a retornar.
+        offset (int): Usuarios a omitir.
 
     Returns:
         List[UsuarioOut]: Lista de usuarios disponibles.
     """
-    return await crud_usuarios.get_usuarios(db)
+    return _usuarios_json(await crud_usuarios.get_usuarios(db, limit, offset))
 
 @router.get("/{cedula}", response_model=UsuarioOut)
 async def obtener_usuario(cedula: str, db: AsyncSession = Depends(get_db)):
@@ -65,13 +85,14 @@ async def crear_usuario(usuario: UsuarioCreate, db: AsyncSession = Depends(get_d
     Raises:
         HTTPException: 400 si ya existe un usuario con la misma cédula
     """
-    try:
-        return await crud_usuarios.create_usuario(db, usuario.cedula, usuario.nombre)
-    except IntegrityError as exc:
+    nuevo = await crud_usuarios.create_usuario(db, usuario.cedula, usuario.nombre)
+    # ON CONFLICT DO NOTHING: sin fila creada la cédula ya está registrada
+    if nuevo is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Ya existe un usuario con esa cédula"
-        ) from exc
+        )
+    return nuevo
 
 @router.delete("/{cedula}", status_code=status.HTTP_204_NO_CONTENT)
 async def eliminar_usuario(cedula: str, db: AsyncSession = Depends(get_db)):
@@ -85,8 +106,7 @@ async def eliminar_usuario(cedula: str, db: AsyncSession = Depends(get_db)):
     Raises:
         HTTPException: 404 si el usuario no existe
     """
-    usuario = await crud_usuarios.delete_usuario_by_cedula(db, cedula)
-    if not usuario:
+    if not await crud_usuarios.delete_usuario_by_cedula(db, cedula):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Usuario no encontrado"
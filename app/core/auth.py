@@ -1,22 +1,48 @@
+import time
 from datetime import datetime, timedelta, timezone
-from jose import JWTError, jwt
+from functools import lru_cache
+import jwt
+from jwt import InvalidTokenError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from app.core.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.core.cache import TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/loginU")  # importante para Swagger
 
+# Clave HMAC preparada una sola vez (bytes): PyJWT la usa tal cual en cada firma/verificación
+_SIGNING_KEY = SECRET_KEY.encode()
+
+# Tokens rechazados recientemente: se responden 401 sin volver a verificar la firma
+_tokens_invalidos = TTLCache(ttl=5, maxsize=10000)
+
 def crear_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc)+ timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
+
+@lru_cache(maxsize=65536)
+def _decodificar_token(token: str) -> dict:
+    """
+    Verifica la firma del token y retorna su payload, memoizado por el string del token.
+
+    Los tokens inválidos lanzan `InvalidTokenError` y por tanto no quedan en caché; la expiración
+    de los tokens cacheados la vuelve a comprobar `verificar_token` en cada uso.
+    """
+    return jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM])
 
-def verificar_token(token: str = Depends(oauth2_scheme)) -> dict:
+async def verificar_token(token: str = Depends(oauth2_scheme)) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError as exc:
+        if _tokens_invalidos.get(token):
+            raise InvalidTokenError("Token rechazado recientemente.")
+        payload = _decodificar_token(token)
+        exp = payload.get("exp")
+        if exp is not None and exp < time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+        return dict(payload)
+    except InvalidTokenError as exc:
+        _tokens_invalidos.set(token, True)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token inválido o expirado",
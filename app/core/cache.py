@@ -0,0 +1,50 @@
+"""
+Caché en memoria con expiración (TTL) para datos casi estáticos.
+
+Se usa en rutas de validación muy frecuentes (existencia de eventos, vigencia de grupos)
+para evitar un viaje a la base de datos por request. La caché es local a cada proceso
+worker; las funciones CRUD que modifican los datos son responsables de invalidarla.
+"""
+
+import time
+from typing import Any, Hashable, Optional
+
+class TTLCache:
+    """
+    Diccionario con expiración por entrada y tamaño máximo.
+
+    Al alcanzar `maxsize` se descarta la entrada más antigua (orden de inserción).
+
+    Atributos:
+        ttl (float): Segundos de vida de cada entrada.
+        maxsize (int): Número máximo de entradas almacenadas.
+    """
+
+    def __init__(self, ttl: float = 60, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict = {}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Retorna el valor vigente para `key` o `default` si no existe o expiró."""
+        item = self._data.get(key)
+        if item is None:
+            return default
+        expira, valor = item
+        if expira < time.monotonic():
+            self._data.pop(key, None)
+            return default
+        return valor
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Guarda `value` bajo `key` con el TTL configurado."""
+        if key not in self._data and len(self._data) >= self.maxsize:
+            self._data.pop(next(iter(self._data)))
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Elimina la entrada `key`, o todas si no se indica ninguna."""
+        if key is None:
+            self._data.clear()
+        else:
+            self._data.pop(key, None)
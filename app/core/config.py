@@ -1,5 +1,22 @@
 import os
+from dotenv import load_dotenv
 
+# Se carga .env una sola vez al importar la configuración; el resto de módulos lee de aquí.
+# En prod las variables vienen del entorno del servicio y no se lee el archivo
+if os.getenv("APP_ENV", "dev") != "prod":
+    load_dotenv()
+
+APP_ENV = os.getenv("APP_ENV", "dev")
 SECRET_KEY = os.getenv("SECRET_KEY", "tu_clave_secreta_super_segura")
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 30
\ No newline at end of file
+ACCESS_TOKEN_EXPIRE_MINUTES = 30
+
+# Cache-Control de los GET públicos de catálogo (secciones, eventos). El max-age coincide
+# con el TTL de las cachés en memoria para que un proxy o CDN no sirva datos más viejos
+CACHE_CONTROL_PUBLICO = os.getenv("CACHE_CONTROL_PUBLICO", "public, max-age=30")
+
+# Orígenes permitidos por CORS, separados por comas ("*" = cualquiera). La API se autentica
+# con tokens Bearer y no con cookies, así que las respuestas CORS no habilitan credenciales
+ALLOWED_ORIGINS = tuple(
+    origen.strip() for origen in os.getenv("ALLOWED_ORIGINS", "*").split(",") if origen.strip()
+)
@@ -0,0 +1,97 @@
+"""
+Middleware ASGI que agrega `ETag` a las respuestas JSON de los GET y responde
+`304 Not Modified` cuando el cliente envía un `If-None-Match` que coincide.
+
+El ETag es el hash xxh64 del cuerpo ya serializado, por lo que no requiere
+que los endpoints calculen versiones; el ahorro está en los bytes enviados.
+Se implementa como ASGI puro (no `BaseHTTPMiddleware`) para no agregar una
+tarea extra por request.
+"""
+
+import xxhash
+
+def _es_json(headers) -> bool:
+    """
+    Indica si la respuesta declara `Content-Type: application/json` y `Content-Length`.
+
+    Las respuestas sin `Content-Length` se transmiten por partes (`StreamingResponse`) y
+    no se acumulan para calcular el ETag.
+    """
+    json = longitud = False
+    for clave, valor in headers:
+        if clave == b"content-type":
+            json = valor.startswith(b"application/json")
+        elif clave == b"content-length":
+            longitud = True
+    return json and longitud
+
+def _coincide(if_none_match: bytes, etag: bytes) -> bool:
+    """Compara el `If-None-Match` del cliente con el ETag (comparación débil)."""
+    if if_none_match.strip() == b"*":
+        return True
+    for candidato in if_none_match.split(b","):
+        candidato = candidato.strip()
+        if candidato.startswith(b"W/"):
+            candidato = candidato[2:]
+        if candidato == etag:
+            return True
+    return False
+
+class ETagMiddleware:
+    """
+    Calcula el ETag de las respuestas 200 JSON de los GET.
+
+    Las demás respuestas (otros métodos, estados, tipos de contenido o respuestas
+    transmitidas por partes) pasan sin tocar.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = None
+        for clave, valor in scope["headers"]:
+            if clave == b"if-none-match":
+                if_none_match = valor
+                break
+
+        inicio = None
+        partes = []
+
+        async def send_con_etag(message):
+            nonlocal inicio
+            if message["type"] == "http.response.start":
+                if message["status"] == 200 and _es_json(message.get("headers", [])):
+                    inicio = message
+                    return
+                inicio = False
+            if not inicio or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            partes.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(partes)
+            etag = b'"' + xxhash.xxh64_hexdigest(body).encode() + b'"'
+            headers = [(k, v) for k, v in inicio.get("headers", []) if k != b"etag"]
+
+            if if_none_match is not None and _coincide(if_none_match, etag):
+                headers = [
+                    (k, v) for k, v in headers if k not in (b"content-length", b"content-type")
+                ]
+                headers.append((b"etag", etag))
+                await send({"type": "http.response.start", "status": 304, "headers": headers})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            headers.append((b"etag", etag))
+            await send({**inicio, "headers": headers})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_con_etag)
@@ -1,33 +1,68 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 
 class MyLogger:
     """
     Logger personalizado para el proyecto. Puede escribirse a consola y/o archivo.
+
+    Los registros se encolan con un `QueueHandler` y un hilo `QueueListener` los escribe
+    en consola y archivo, de modo que el event loop no se bloquea en E/S de disco.
     """
 
-    def __init__(self, level: str = "INFO", log_file: str = "logs/app.log"):
-        # Asegurar que el directorio exista
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+    _NOMBRE = "TriviaApp"
+    _listener = None
 
-        self.logger = logging.getLogger("TriviaApp")
-        self.logger.setLevel(level.upper())
+    def __init__(self, level: str = "INFO", log_file: str = "logs/app.log"):
+        self.logger = logging.getLogger(MyLogger._NOMBRE)
 
-        # Evita duplicar handlers si ya está configurado
+        # La configuración (directorio, handlers, formato) se hace solo la primera vez;
+        # las siguientes instancias solo recuperan el logger ya configurado
         if not self.logger.handlers:
+            self.logger.setLevel(level.upper())
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            formatter = self._get_formatter()
+
             # Consola
             console_handler = logging.StreamHandler()
-            console_handler.setFormatter(self._get_formatter())
-            self.logger.addHandler(console_handler)
+            console_handler.setFormatter(formatter)
 
             # Archivo con rotación
             file_handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=5)
-            file_handler.setFormatter(self._get_formatter())
-            self.logger.addHandler(file_handler)
+            file_handler.setFormatter(formatter)
+
+            # El request solo encola el registro; la escritura ocurre en el hilo del listener
+            cola = queue.Queue(-1)
+            self.logger.addHandler(QueueHandler(cola))
+            MyLogger._listener = QueueListener(cola, console_handler, file_handler)
+            MyLogger._listener.start()
+            atexit.register(MyLogger.detener)
 
     def _get_formatter(self):
         return logging.Formatter("[%(asctime)s] %(levelname)s - %(message)s", "%Y-%m-%d %H:%M:%S")
 
     def get_logger(self):
-        return self.logger
\ No newline at end of file
+        return self.logger
+
+    @classmethod
+    def detener(cls):
+        """
+        Vacía la cola de registros pendientes y detiene el hilo del listener.
+
+        Después el logger escribe directo en consola y archivo: sin listener, lo que se
+        siguiera encolando (p. ej. durante el apagado) no llegaría a escribirse.
+        """
+        listener = cls._listener
+        if listener is None:
+            return
+        listener.stop()
+        cls._listener = None
+
+        logger = logging.getLogger(cls._NOMBRE)
+        for handler in list(logger.handlers):
+            if isinstance(handler, QueueHandler):
+                logger.removeHandler(handler)
+        for handler in listener.handlers:
+            logger.addHandler(handler)
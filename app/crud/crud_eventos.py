@@ -1,40 +1,107 @@
+from typing import Iterable, Optional, Set
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.models.evento import Evento, TipoLogin
+from app.core.cache import TTLCache
+from app.crud.crud_grupos import invalidar_cache_grupo
+from app.crud.crud_secciones import invalidar_cache_secciones
 
 from app.core.logger import MyLogger
 logger = MyLogger().get_logger()
 
-async def get_eventos(db: AsyncSession):
-    result = await db.execute(select(Evento))
-    return result.scalars().all()
+# IDs de eventos existentes, validados en cada request de preguntas/secciones/grupos
+_eventos_cache = TTLCache(ttl=60, maxsize=1024)
+
+# Páginas del listado de eventos; create_evento y delete_evento la vacían
+_listado_eventos_cache = TTLCache(ttl=30, maxsize=256)
+
+# Columnas de EventoOut: el listado devuelve filas (Row) sin instancias ORM
+_COLUMNAS_EVENTO = (Evento.id_evento, Evento.nombre_evento, Evento.tipo_login)
+
+async def get_eventos(db: AsyncSession, limit: Optional[int] = None, offset: int = 0):
+    clave = (limit, offset)
+    eventos = _listado_eventos_cache.get(clave)
+    if eventos is None:
+        stmt = select(*_COLUMNAS_EVENTO).order_by(Evento.id_evento).limit(limit).offset(offset)
+        result = await db.execute(stmt)
+        eventos = result.all()
+        _listado_eventos_cache.set(clave, eventos)
+    return eventos
 
 async def get_by_id(db: AsyncSession, id_evento: int):
-    stmt = select(Evento).where(Evento.id_evento == id_evento)
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    # Búsqueda por PK: si la sesión ya cargó el evento no se consulta la base de datos
+    return await db.get(Evento, id_evento)
+
+async def evento_existe(db: AsyncSession, id_evento: int) -> bool:
+    """
+    Verifica si un evento existe, usando una caché en memoria con TTL.
+
+    Solo se cachean los eventos encontrados; `delete_evento` invalida la entrada.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos.
+        id_evento (int): ID del evento.
+
+    Returns:
+        bool: True si el evento existe.
+    """
+    if _eventos_cache.get(id_evento):
+        return True
+    stmt = select(Evento.id_evento).where(Evento.id_evento == id_evento)
+    existe = (await db.execute(stmt)).scalar_one_or_none() is not None
+    if existe:
+        _eventos_cache.set(id_evento, True)
+    return existe
+
+async def get_eventos_existentes(db: AsyncSession, ids_evento: Iterable[int]) -> Set[int]:
+    """
+    Retorna cuáles de los IDs indicados corresponden a eventos existentes.
+
+    Los IDs ya cacheados no se consultan; el resto se verifica con una sola consulta `IN`.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos.
+        ids_evento (Iterable[int]): IDs de eventos a verificar.
+
+    Returns:
+        Set[int]: Subconjunto de `ids_evento` que existe.
+    """
+    ids = set(ids_evento)
+    existentes = {id_evento for id_evento in ids if _eventos_cache.get(id_evento)}
+    pendientes = ids - existentes
+    if pendientes:
+        stmt = select(Evento.id_evento).where(Evento.id_evento.in_(pendientes))
+        for id_evento in (await db.execute(stmt)).scalars():
+            _eventos_cache.set(id_evento, True)
+            existentes.add(id_evento)
+    return existentes
 
 async def get_by_nombre(db: AsyncSession, nombre_evento: str):
-    stmt = select(Evento).where(Evento.nombre_evento == nombre_evento)
+    # Usa el índice único uq_eventos_nombre_lower
+    stmt = select(Evento).where(func.lower(Evento.nombre_evento) == func.lower(nombre_evento))
     result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
-async def create_evento(db: AsyncSession, nombre_evento: str, tipo_login: TipoLogin) -> Evento:
+async def create_evento(db: AsyncSession, nombre_evento: str, tipo_login: TipoLogin) -> Optional[Evento]:
     """
     Crea un nuevo evento en la base de datos.
 
+    Se ejecuta un único `INSERT ... ON CONFLICT DO NOTHING RETURNING`: si el nombre ya
+    existe (índice `uq_eventos_nombre_lower`) no se inserta nada y se retorna None, sin
+    consulta previa ni ventana entre la verificación y la inserción.
+
     Args:
         db (AsyncSession): Sesión de base de datos.
         nombre_evento (str): Nombre único del evento.
         tipo_login (TipoLogin): Enum que indica el tipo de login asociado.
 
     Returns:
-        Evento: Objeto de evento creado.
+        Optional[Evento]: Objeto de evento creado, o None si ya existe uno con ese nombre.
 
     Raises:
         ValueError: Si el tipo_login es inválido.
-        IntegrityError: Si ocurre un conflicto de integridad al guardar.
     """
     # Validación defensiva por si llega un string en lugar del Enum
     if isinstance(tipo_login, str):
@@ -44,21 +111,23 @@ async def create_evento(db: AsyncSession, nombre_evento: str, tipo_login: TipoLo
             logger.warning("Tipo de login inválido: %s", tipo_login)
             raise ValueError(f"Tipo de login inválido: {tipo_login}") from e
 
-    nuevo_evento = Evento(nombre_evento=nombre_evento, tipo_login=tipo_login)
     logger.info("Creando evento: %s (tipo_login=%s)", nombre_evento, tipo_login)
+    stmt = (
+        pg_insert(Evento)
+        .values(nombre_evento=nombre_evento, tipo_login=tipo_login)
+        .on_conflict_do_nothing()
+        .returning(Evento)
+    )
+    nuevo_evento = (await db.execute(stmt)).scalar_one_or_none()
+    await db.commit()
 
-    db.add(nuevo_evento)
-
-    try:
-        await db.commit()
-        await db.refresh(nuevo_evento)
-        logger.info("Evento creado exitosamente: id=%s", nuevo_evento.id_evento)
-        return nuevo_evento
+    if nuevo_evento is None:
+        logger.warning("Evento duplicado: %s", nombre_evento)
+        return None
 
-    except IntegrityError as e:
-        await db.rollback()
-        logger.error("Error al crear evento '%s': %s", nombre_evento, str(e), exc_info=True)
-        raise IntegrityError(f"Conflicto al guardar el evento: {nombre_evento}", e.params, e.orig) from e
+    _listado_eventos_cache.invalidate()
+    logger.info("Evento creado exitosamente: id=%s", nuevo_evento.id_evento)
+    return nuevo_evento
 
 async def delete_evento(db: AsyncSession, evento: Evento):
     """
@@ -73,4 +142,9 @@ async def delete_evento(db: AsyncSession, evento: Evento):
     """
     await db.delete(evento)
     await db.commit()
+    _eventos_cache.invalidate(evento.id_evento)
+    _listado_eventos_cache.invalidate()
+    # Los grupos y secciones del evento se eliminan en cascada
+    invalidar_cache_grupo()
+    invalidar_cache_secciones()
     logger.info("Evento eliminado: id=%s", evento.id_evento)
\ No newline at end of file
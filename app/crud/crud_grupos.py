@@ -5,49 +5,118 @@ Este módulo contiene las funciones para crear, leer, actualizar y eliminar grup
 en la base de datos usando SQLAlchemy de manera asíncrona.
 """
 from datetime import datetime, timezone
-from typing import Optional
-from sqlalchemy import between
+from functools import lru_cache
+from typing import Optional, Tuple
+from sqlalchemy import tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
-from app.models.grupo import Grupo
+from app.models.grupo import Grupo, VIGENCIA_GRUPO
+from app.db.connection import commit_asincrono
+from app.core.cache import TTLCache
 
+UTC = timezone.utc
+
+# Vigencia (inicio, cierre) en segundos epoch por id_grupo, consultada en cada loginU
+_periodos_cache = TTLCache(ttl=60, maxsize=1024)
+
+# Columnas de GrupoOut: los listados devuelven filas (Row) sin instancias ORM
+_COLUMNAS_GRUPO = (
+    Grupo.id_grupo,
+    Grupo.id_evento,
+    Grupo.nombre_grupo,
+    Grupo.fecha_inicio,
+    Grupo.fecha_cierre,
+    Grupo.max_intentos,
+    Grupo.cooldown,
+)
+
+# Sentencia base de los listados, construida una sola vez: cada llamada solo agrega
+# filtros y paginación, y la forma compilada se reutiliza desde la caché de SQLAlchemy
+_SELECT_GRUPOS = select(*_COLUMNAS_GRUPO)
 
 def ensure_utc(dt: datetime) -> datetime:
     """
-    Asegura que el objeto datetime tenga zona horaria UTC.
+    Asegura que el objeto datetime tenga zona horaria; las fechas sin zona se toman como UTC.
+
+    Las fechas que ya tienen zona se retornan sin convertir: PostgreSQL (timestamptz) y
+    `timestamp()` comparan el mismo instante sin importar la zona.
     """
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)
+
+@lru_cache(maxsize=4096)
+def _normalizar_nombre(nombre_grupo: str) -> str:
+    """Quita espacios y pasa el nombre a formato título; memorizado porque los nombres se repiten."""
+    return nombre_grupo.strip().title()
 
-async def get_grupos(db: AsyncSession):
+def _paginar(stmt, limit: Optional[int], offset: int, despues: Optional[Tuple[datetime, int]]):
     """
-    Obtiene todos los grupos.
+    Ordena por (fecha_inicio, id_grupo) y aplica la página pedida.
+
+    Con `despues` (cursor = fecha_inicio e id_grupo del último grupo recibido) la página
+    empieza justo después de esa fila mediante una búsqueda en el índice, sin recorrer ni
+    descartar las filas anteriores como hace OFFSET.
+    """
+    if despues is not None:
+        fecha_inicio, id_grupo = despues
+        stmt = stmt.where(
+            tuple_(Grupo.fecha_inicio, Grupo.id_grupo) > tuple_(ensure_utc(fecha_inicio), id_grupo)
+        )
+    return stmt.order_by(Grupo.fecha_inicio, Grupo.id_grupo).limit(limit).offset(offset)
+
+async def get_grupos(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    despues: Optional[Tuple[datetime, int]] = None
+):
+    """
+    Obtiene los grupos, paginados.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
+        limit (Optional[int]): Máximo de registros a retornar (None = sin límite).
+        offset (int): Registros a omitir.
+        despues (Optional[Tuple[datetime, int]]): Cursor (fecha_inicio, id_grupo) del último
+            grupo de la página anterior.
 
     Returns:
-        List[Grupo]: Lista de todos los grupos.
+        List[Row]: Filas con las columnas de los grupos.
     """
-    result = await db.execute(select(Grupo).order_by(Grupo.fecha_inicio))
-    return result.scalars().all()
+    stmt = _paginar(_SELECT_GRUPOS, limit, offset, despues)
+    result = await db.execute(stmt)
+    return result.all()
 
-async def get_grupos_by_evento(db: AsyncSession, id_evento: int):
+async def get_grupos_by_evento(
+    db: AsyncSession,
+    id_evento: int,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    despues: Optional[Tuple[datetime, int]] = None
+):
     """
-    Obtiene todos los grupos de un evento específico.
+    Obtiene los grupos de un evento específico, paginados.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
         id_evento (int): ID del evento.
+        limit (Optional[int]): Máximo de registros a retornar (None = sin límite).
+        offset (int): Registros a omitir.
+        despues (Optional[Tuple[datetime, int]]): Cursor (fecha_inicio, id_grupo) del último
+            grupo de la página anterior.
 
     Returns:
-        List[Grupo]: Lista de grupos del evento.
+        List[Row]: Filas con las columnas de los grupos del evento.
     """
-    stmt = select(Grupo).where(Grupo.id_evento == id_evento).order_by(Grupo.fecha_inicio)
+    stmt = _paginar(
+        _SELECT_GRUPOS.where(Grupo.id_evento == id_evento),
+        limit,
+        offset,
+        despues
+    )
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return result.all()
 
 async def get_grupo_by_id(db: AsyncSession, id_grupo: int) -> Optional[Grupo]:
     """
@@ -60,11 +129,84 @@ async def get_grupo_by_id(db: AsyncSession, id_grupo: int) -> Optional[Grupo]:
     Returns:
         Optional[Grupo]: El grupo encontrado o None si no existe.
     """
-    stmt = select(Grupo).where(Grupo.id_grupo == id_grupo)
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    # Búsqueda por PK: si la sesión ya cargó el grupo no se consulta la base de datos
+    return await db.get(Grupo, id_grupo)
 
-async def create_grupo(
+def _periodo_epoch(fecha_inicio: datetime, fecha_cierre: datetime) -> Tuple[float, float]:
+    """
+    Convierte la vigencia de un grupo a segundos epoch para compararla con `time.time()`.
+    """
+    return ensure_utc(fecha_inicio).timestamp(), ensure_utc(fecha_cierre).timestamp()
+
+async def get_periodo_grupo(db: AsyncSession, id_grupo: int) -> Optional[Tuple[float, float]]:
+    """
+    Obtiene la vigencia de un grupo en segundos epoch, usando una caché en memoria con TTL.
+
+    Solo se cachean grupos existentes; `update_grupo` y `delete_grupo` invalidan la entrada.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos.
+        id_grupo (int): ID del grupo.
+
+    Returns:
+        Optional[Tuple[float, float]]: (inicio, cierre) en epoch o None si el grupo no existe.
+    """
+    periodo = _periodos_cache.get(id_grupo)
+    if periodo is None:
+        stmt = select(Grupo.fecha_inicio, Grupo.fecha_cierre).where(Grupo.id_grupo == id_grupo)
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        periodo = _periodo_epoch(row.fecha_inicio, row.fecha_cierre)
+        _periodos_cache.set(id_grupo, periodo)
+    return periodo
+
+async def get_grupo_activo(
+    db: AsyncSession,
+    id_grupo: int,
+    ahora: float
+) -> Optional[Tuple[float, float]]:
+    """
+    Obtiene la vigencia de un grupo solo si el instante `ahora` (epoch) cae dentro de ella.
+
+    El filtro de fechas se evalúa en SQL, de modo que un grupo cerrado o inexistente
+    no devuelve filas. Si la vigencia ya está en caché se compara en epoch sin consultar
+    ni construir objetos datetime.
+    Un resultado None no distingue entre grupo inexistente y fuera de período; para eso
+    usar `get_periodo_grupo`.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos.
+        id_grupo (int): ID del grupo.
+        ahora (float): Instante a verificar en segundos epoch (p. ej. `time.time()`).
+
+    Returns:
+        Optional[Tuple[float, float]]: (inicio, cierre) en epoch si el grupo está activo.
+    """
+    periodo = _periodos_cache.get(id_grupo)
+    if periodo is not None:
+        return periodo if periodo[0] <= ahora <= periodo[1] else None
+
+    fecha = datetime.fromtimestamp(ahora, UTC)
+    stmt = select(Grupo.fecha_inicio, Grupo.fecha_cierre).where(
+        Grupo.id_grupo == id_grupo,
+        Grupo.fecha_inicio <= fecha,
+        Grupo.fecha_cierre >= fecha
+    )
+    row = (await db.execute(stmt)).one_or_none()
+    if row is None:
+        return None
+    periodo = _periodo_epoch(row.fecha_inicio, row.fecha_cierre)
+    _periodos_cache.set(id_grupo, periodo)
+    return periodo
+
+def invalidar_cache_grupo(id_grupo: Optional[int] = None) -> None:
+    """
+    Invalida la vigencia cacheada de un grupo, o de todos si no se indica `id_grupo`.
+    """
+    _periodos_cache.invalidate(id_grupo)
+
+async def create_grupo_sin_commit(
     db: AsyncSession,
     id_evento: int,
     nombre_grupo: str,
@@ -72,20 +214,57 @@ async def create_grupo(
     fecha_cierre: datetime,
     max_intentos: int = 1,
     cooldown = None
-) -> Grupo:
-    """Crea un nuevo grupo con cooldown e intentos máximos."""
-    nuevo = Grupo(
-        id_evento=id_evento,
-        nombre_grupo=nombre_grupo.strip().title(),
-        fecha_inicio=fecha_inicio,
-        fecha_cierre=fecha_cierre,
-        max_intentos=max_intentos,
-        cooldown=cooldown
+) -> Optional[Grupo]:
+    """
+    Inserta un grupo en la transacción en curso, sin confirmarla.
+
+    El llamador confirma (una vez para varias escrituras), hace rollback si algo falla e
+    invalida la caché de vigencias si corresponde.
+
+    Returns:
+        Optional[Grupo]: El grupo creado, o None si el nombre ya existe en el evento.
+
+    Raises:
+        IntegrityError: Si el evento no existe (violación de llave foránea).
+    """
+    valores = {
+        "id_evento": id_evento,
+        "nombre_grupo": _normalizar_nombre(nombre_grupo),
+        "fecha_inicio": fecha_inicio,
+        "fecha_cierre": fecha_cierre,
+        "max_intentos": max_intentos,
+    }
+    # Sin cooldown se aplica el valor por defecto de la columna
+    if cooldown is not None:
+        valores["cooldown"] = cooldown
+    stmt = (
+        pg_insert(Grupo)
+        .values(**valores)
+        .on_conflict_do_nothing(index_elements=["id_evento", "nombre_grupo"])
+        .returning(Grupo)
     )
-    db.add(nuevo)
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+async def create_grupo(
+    db: AsyncSession,
+    id_evento: int,
+    nombre_grupo: str,
+    fecha_inicio: datetime,
+    fecha_cierre: datetime,
+    max_intentos: int = 1,
+    cooldown = None
+) -> Optional[Grupo]:
+    """
+    Crea un nuevo grupo con cooldown e intentos máximos.
+
+    Usa `INSERT ... ON CONFLICT DO NOTHING RETURNING`: si el nombre ya existe en el evento
+    retorna None sin excepción ni rollback.
+    """
     try:
-        await db.commit()
-        await db.refresh(nuevo)
+        nuevo = await create_grupo_sin_commit(
+            db, id_evento, nombre_grupo, fecha_inicio, fecha_cierre, max_intentos, cooldown
+        )
+        await commit_asincrono(db)
         return nuevo
     except IntegrityError:
         await db.rollback()
@@ -105,7 +284,7 @@ async def update_grupo(
     if not grupo:
         return None
     if nombre_grupo is not None:
-        grupo.nombre_grupo = nombre_grupo.strip().title()
+        grupo.nombre_grupo = _normalizar_nombre(nombre_grupo)
     if fecha_inicio is not None:
         grupo.fecha_inicio = fecha_inicio
     if fecha_cierre is not None:
@@ -115,8 +294,10 @@ async def update_grupo(
     if cooldown is not None:
         grupo.cooldown = cooldown
     try:
-        await db.commit()
-        await db.refresh(grupo)
+        await commit_asincrono(db)
+        invalidar_cache_grupo(id_grupo)
+        # Todos los valores se asignaron en memoria y la sesión no expira al confirmar,
+        # por lo que no hace falta recargar el grupo
         return grupo
     except IntegrityError:
         await db.rollback()
@@ -132,24 +313,32 @@ async def delete_grupo(db: AsyncSession, grupo: Grupo):
     """
     await db.delete(grupo)
     await db.commit()
+    invalidar_cache_grupo(grupo.id_grupo)
 
-async def get_grupos_activos(db: AsyncSession, fecha: datetime = None, evento_id: int = None):
+async def get_grupos_activos(
+    db: AsyncSession,
+    fecha: datetime = None,
+    evento_id: int = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    despues: Optional[Tuple[datetime, int]] = None
+):
     """
-    Recupera todos los grupos existentes en la base de datos, ordenados por fecha de inicio.
+    Recupera los grupos vigentes en `fecha`, ordenados por fecha de inicio y paginados
+    por `offset` o por el cursor `despues` (fecha_inicio, id_grupo).
     """
     if fecha is None:
-        fecha = datetime.now(timezone.utc)
+        fecha = datetime.now(UTC)
     else:
         fecha = ensure_utc(fecha)
 
-    stmt = select(Grupo).where(
-        between(fecha, Grupo.fecha_inicio, Grupo.fecha_cierre)
-    )
+    # Usa el índice GiST idx_grupo_activo sobre la vigencia
+    stmt = _SELECT_GRUPOS.where(VIGENCIA_GRUPO.op("@>")(fecha))
 
     if evento_id is not None:
         stmt = stmt.where(Grupo.id_evento == evento_id)
 
-    stmt = stmt.order_by(Grupo.fecha_inicio)
+    stmt = _paginar(stmt, limit, offset, despues)
 
     result = await db.execute(stmt)
-    return result.scalars().all()
\ No newline at end of file
+    return result.all()
\ No newline at end of file
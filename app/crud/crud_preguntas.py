@@ -5,15 +5,17 @@ Este módulo contiene las funciones para crear, leer, actualizar y eliminar preg
 en la base de datos usando SQLAlchemy de manera asíncrona.
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, insert
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, contains_eager
 from sqlalchemy.exc import IntegrityError
 from app.models.pregunta import Pregunta
 from app.models.respuesta import Respuesta
 from app.schemas.pregunta import RespuestaCreate
 from app.models.seccion import Seccion
+from app.db.connection import commit_asincrono
 
 async def get_preguntas(db: AsyncSession):
     """
@@ -25,16 +27,42 @@ async def get_preguntas(db: AsyncSession):
     Returns:
         List[Pregunta]: Lista de todas las preguntas.
     """
-    stmt = select(Pregunta).options(selectinload(Pregunta.respuestas)).order_by(Pregunta.id_pregunta)
+    stmt = (
+        select(Pregunta)
+        .options(
+            selectinload(Pregunta.respuestas),
+            selectinload(Pregunta.seccion)
+        )
+        .order_by(Pregunta.id_pregunta)
+    )
     result = await db.execute(stmt)
-    preguntas = result.scalars().all()
-    
-    # Ordenar las respuestas de cada pregunta
-    for pregunta in preguntas:
-        if pregunta.respuestas:
-            pregunta.respuestas.sort(key=lambda x: getattr(x, "orden", 0))
-    
-    return preguntas
+    return result.scalars().all()
+
+async def iter_preguntas(db: AsyncSession, lote: int = 200) -> AsyncIterator[Pregunta]:
+    """
+    Recorre todas las preguntas con sus respuestas sin cargarlas todas en memoria.
+
+    Las filas se leen en lotes de `lote` (`yield_per`) y las relaciones se cargan con un
+    `selectinload` por lote, así la memoria queda acotada al tamaño del lote.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos; debe seguir abierta durante el recorrido.
+        lote (int): Preguntas por lote.
+
+    Yields:
+        Pregunta: Cada pregunta, en orden de ID.
+    """
+    stmt = (
+        select(Pregunta)
+        .options(
+            selectinload(Pregunta.respuestas),
+            selectinload(Pregunta.seccion)
+        )
+        .order_by(Pregunta.id_pregunta)
+        .execution_options(yield_per=lote)
+    )
+    async for pregunta in await db.stream_scalars(stmt):
+        yield pregunta
 
 async def get_preguntas_by_seccion(db: AsyncSession, id_seccion: int):
     """
@@ -49,19 +77,15 @@ async def get_preguntas_by_seccion(db: AsyncSession, id_seccion: int):
     """
     stmt = (
         select(Pregunta)
-        .options(selectinload(Pregunta.respuestas))
+        .options(
+            selectinload(Pregunta.respuestas),
+            selectinload(Pregunta.seccion)
+        )
         .where(Pregunta.id_seccion == id_seccion)
         .order_by(Pregunta.id_pregunta)
     )
     result = await db.execute(stmt)
-    preguntas = result.scalars().all()
-    
-    # Ordenar las respuestas de cada pregunta
-    for pregunta in preguntas:
-        if pregunta.respuestas:
-            pregunta.respuestas.sort(key=lambda x: getattr(x, "orden", 0))
-    
-    return preguntas
+    return result.scalars().all()
 
 async def get_pregunta(db: AsyncSession, id_pregunta: int):
     """
@@ -72,33 +96,33 @@ async def get_pregunta(db: AsyncSession, id_pregunta: int):
         id_pregunta (int): ID de la pregunta a buscar.
 
     Returns:
-        Optional[Pregunta]: La pregunta encontrada con sus respuestas ordenadas o None si no existe.
+        Optional[Pregunta]: La pregunta encontrada con sus respuestas (ordenadas por `orden`) o None si no existe.
     """
-    stmt = (
-        select(Pregunta)
-        .options(
-            selectinload(Pregunta.respuestas).selectinload(Respuesta.pregunta)
-        )
-        .where(Pregunta.id_pregunta == id_pregunta)
+    # Búsqueda por PK: si la sesión ya cargó la pregunta no se consulta la base de datos
+    return await db.get(
+        Pregunta,
+        id_pregunta,
+        options=[
+            # Respuesta.pregunta no se carga: es la misma pregunta, ya en el identity map
+            selectinload(Pregunta.respuestas),
+            selectinload(Pregunta.seccion)
+        ]
     )
-    result = await db.execute(stmt)
-    pregunta = result.scalar_one_or_none()
-    
-    if pregunta and pregunta.respuestas:
-        pregunta.respuestas.sort(key=lambda x: getattr(x, "orden", 0))
-    
-    return pregunta
 
-async def create_pregunta(
+async def create_pregunta_sin_commit(
     db: AsyncSession,
     id_seccion: int,
     pregunta: str,
     tipo_pregunta: str,
     respuestas: Optional[List[RespuestaCreate]] = None,
     opcion_correcta: Optional[int] = None
-):
+) -> Pregunta:
     """
-    Crea una nueva pregunta con sus respuestas.
+    Inserta una pregunta con sus respuestas en la transacción en curso, sin confirmarla.
+
+    Hace flush (IDs por RETURNING) y carga la sección, así el resultado se puede serializar
+    como `PreguntaOut`. El llamador confirma (una vez para varias preguntas) y hace
+    rollback si algo falla.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
@@ -108,34 +132,62 @@ async def create_pregunta(
         opcion_correcta (int): Número de la opción correcta (1-4).
 
     Returns:
-        Pregunta: La pregunta creada con sus respuestas.
+        Pregunta: La pregunta creada con sus respuestas y su sección.
 
     Raises:
         IntegrityError: Si ya existe una pregunta con el mismo texto en la sección.
     """
-    # Crear la pregunta
+    # Crear la pregunta con sus respuestas (solo si es opción única): el flush inserta la
+    # pregunta y luego todas las respuestas en un solo INSERT por lotes
+    nuevas_respuestas = []
+    if tipo_pregunta == "opcion_unica" and respuestas:
+        nuevas_respuestas = [
+            Respuesta(orden=resp.orden, respuesta=resp.respuesta)
+            for resp in sorted(respuestas, key=lambda r: r.orden)
+        ]
     nueva_pregunta = Pregunta(
         id_seccion=id_seccion,
         pregunta=pregunta,
         tipo_pregunta=tipo_pregunta,
-        opcion_correcta=opcion_correcta if tipo_pregunta == "opcion_unica" else None
+        opcion_correcta=opcion_correcta if tipo_pregunta == "opcion_unica" else None,
+        respuestas=nuevas_respuestas
     )
     db.add(nueva_pregunta)
-    try:
-        await db.flush()  # Para obtener el id_pregunta y validar duplicados
-
-        # Crear las respuestas solo si es opción única
-        if tipo_pregunta == "opcion_unica" and respuestas:
-            for resp in respuestas:
-                respuesta = Respuesta(
-                    id_pregunta=nueva_pregunta.id_pregunta,
-                    orden=resp.orden,
-                    respuesta=resp.respuesta
-                )
-                db.add(respuesta)
+    await db.flush()
+    # Los IDs de la pregunta y sus respuestas llegan por RETURNING en el flush; solo
+    # falta cargar la sección
+    await db.refresh(nueva_pregunta, ["seccion"])
+    return nueva_pregunta
+
+async def create_pregunta(
+    db: AsyncSession,
+    id_seccion: int,
+    pregunta: str,
+    tipo_pregunta: str,
+    respuestas: Optional[List[RespuestaCreate]] = None,
+    opcion_correcta: Optional[int] = None
+):
+    """
+    Crea una nueva pregunta con sus respuestas y confirma la transacción.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos.
+        id_seccion (int): ID de la sección a la que pertenece la pregunta.
+        pregunta (str): Texto de la pregunta.
+        respuestas (List[RespuestaCreate]): Lista de respuestas a crear.
+        opcion_correcta (int): Número de la opción correcta (1-4).
 
-        await db.commit()
-        await db.refresh(nueva_pregunta)
+    Returns:
+        Pregunta: La pregunta creada con sus respuestas.
+
+    Raises:
+        IntegrityError: Si ya existe una pregunta con el mismo texto en la sección.
+    """
+    try:
+        nueva_pregunta = await create_pregunta_sin_commit(
+            db, id_seccion, pregunta, tipo_pregunta, respuestas, opcion_correcta
+        )
+        await commit_asincrono(db)
         return nueva_pregunta
     except IntegrityError:
         await db.rollback()
@@ -165,55 +217,70 @@ respuestas: Optional[List[RespuestaCreate]] = None
     if not pregunta_db:
         return None
 
+    # Se calcula antes de escribir: tras el rollback los atributos de pregunta_db expiran
+    cambia_texto = pregunta is not None and pregunta != getattr(pregunta_db, "pregunta")
+
+    # Todo se acumula en la transacción y se confirma con un único commit
     try:
         # Determinar tipo de pregunta
         tipo_pregunta = getattr(pregunta_db, "tipo_pregunta", None)
 
         # Actualizar respuestas solo si es opción única y se proporcionan
         if tipo_pregunta == "opcion_unica" and respuestas is not None:
-            # Eliminar respuestas existentes
-            for resp in pregunta_db.respuestas:
-                await db.delete(resp)
-            await db.flush()
-            # Crear nuevas respuestas
-            for resp in respuestas:
-                nueva_resp = Respuesta(
-                    id_pregunta=id_pregunta,
-                    orden=resp.orden,
-                    respuesta=resp.respuesta
+            # Eliminar las respuestas existentes con un solo DELETE
+            await db.execute(delete(Respuesta).where(Respuesta.id_pregunta == id_pregunta))
+            # Insertar las nuevas en un solo INSERT multi-fila, sin objetos ORM ni RETURNING
+            # (el refresh final de la colección las carga con sus IDs)
+            if respuestas:
+                await db.execute(
+                    insert(Respuesta).values([
+                        {"id_pregunta": id_pregunta, "orden": resp.orden, "respuesta": resp.respuesta}
+                        for resp in respuestas
+                    ])
                 )
-                db.add(nueva_resp)
-            await db.flush()
 
         # Actualizar la opción correcta solo si es opción única
         if tipo_pregunta == "opcion_unica" and opcion_correcta is not None:
             setattr(pregunta_db, "opcion_correcta", opcion_correcta)
-            await db.flush()
 
         # Actualizar el texto de la pregunta si se proporciona
-        if pregunta is not None and pregunta != getattr(pregunta_db, "pregunta"):
+        if cambia_texto:
             setattr(pregunta_db, "pregunta", pregunta)
-            await db.flush()
 
-        await db.commit()
-        await db.refresh(pregunta_db)
+        await commit_asincrono(db)
+        # Solo las respuestas cambiaron fuera del ORM; el resto ya está en memoria
+        if tipo_pregunta == "opcion_unica" and respuestas is not None:
+            await db.refresh(pregunta_db, ["respuestas"])
         return pregunta_db
     except IntegrityError as e:
         await db.rollback()
-        if pregunta is not None and pregunta != pregunta_db.pregunta:
+        if cambia_texto:
             raise
         raise ValueError("Error al actualizar la pregunta: violación de restricción de integridad") from e
 
-async def delete_pregunta(db: AsyncSession, pregunta: Pregunta):
+async def delete_pregunta(db: AsyncSession, id_pregunta: int) -> Optional[int]:
     """
-    Elimina una pregunta y sus respuestas.
+    Elimina una pregunta y sus respuestas en una sola sentencia.
+
+    Usa `DELETE ... RETURNING` para no consultar la pregunta antes de borrarla; las respuestas
+    se eliminan por el `ON DELETE CASCADE` de la base de datos.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
-        pregunta (Pregunta): Instancia de la pregunta a eliminar.
+        id_pregunta (int): ID de la pregunta a eliminar.
+
+    Returns:
+        Optional[int]: El ID eliminado o None si la pregunta no existía.
     """
-    await db.delete(pregunta)
+    stmt = (
+        delete(Pregunta)
+        .where(Pregunta.id_pregunta == id_pregunta)
+        .returning(Pregunta.id_pregunta)
+    )
+    result = await db.execute(stmt)
+    eliminado = result.scalar_one_or_none()
     await db.commit()
+    return eliminado
 
 async def get_preguntas_by_evento(db: AsyncSession, id_evento: int):
     """
@@ -228,20 +295,14 @@ async def get_preguntas_by_evento(db: AsyncSession, id_evento: int):
     """
     stmt = (
         select(Pregunta)
-        .join(Seccion)
+        .join(Pregunta.seccion)
         .options(
             selectinload(Pregunta.respuestas),
-            selectinload(Pregunta.seccion)
+            # La sección ya viene en el JOIN: se hidrata sin una consulta extra
+            contains_eager(Pregunta.seccion)
         )
         .where(Seccion.id_evento == id_evento)
         .order_by(Pregunta.id_pregunta)
     )
     result = await db.execute(stmt)
-    preguntas = result.scalars().all()
-
-    # Ordenar las respuestas de cada pregunta
-    for pregunta in preguntas:
-        if pregunta.respuestas:
-            pregunta.respuestas.sort(key=lambda x: getattr(x, "orden", 0))
-
-    return preguntas
\ No newline at end of file
+    return result.scalars().all()
\ No newline at end of file
@@ -5,57 +5,172 @@ Este módulo contiene las funciones para crear, leer, actualizar y eliminar secc
 en la base de datos usando SQLAlchemy de manera asíncrona.
 """
 
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import Row
+from sqlalchemy import update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.exc import IntegrityError
 from app.models.seccion import Seccion
+from app.db.connection import commit_asincrono
+from app.core.cache import TTLCache
 
-async def get_secciones(db: AsyncSession):
+# Lecturas de secciones (listados y detalle); cualquier escritura vacía la caché completa
+_secciones_cache = TTLCache(ttl=30, maxsize=1024)
+
+# Columnas de SeccionOut: los listados devuelven filas (Row) sin instancias ORM
+_COLUMNAS_SECCION = (Seccion.id_seccion, Seccion.id_evento, Seccion.nombre_seccion)
+
+def invalidar_cache_secciones() -> None:
     """
-    Obtiene todas las secciones.
+    Vacía la caché de lecturas de secciones.
+
+    Se llama tras crear, actualizar o eliminar secciones y al eliminar un evento,
+    cuyas secciones se borran en cascada.
+    """
+    _secciones_cache.invalidate()
+
+async def get_secciones(db: AsyncSession, limit: Optional[int] = None, offset: int = 0):
+    """
+    Obtiene las secciones, paginadas. El resultado se cachea en memoria por página.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
+        limit (Optional[int]): Máximo de registros a retornar (None = sin límite).
+        offset (int): Registros a omitir.
 
     Returns:
-        List[Seccion]: Lista de todas las secciones.
+        List[Row]: Filas con las columnas de la sección.
     """
-    result = await db.execute(select(Seccion).order_by(Seccion.id_seccion))
-    return result.scalars().all()
-
-async def get_secciones_by_evento(db: AsyncSession, id_evento: int):
+    clave = ("todas", limit, offset)
+    secciones = _secciones_cache.get(clave)
+    if secciones is None:
+        stmt = select(*_COLUMNAS_SECCION).order_by(Seccion.id_seccion).limit(limit).offset(offset)
+        result = await db.execute(stmt)
+        secciones = result.all()
+        _secciones_cache.set(clave, secciones)
+    return secciones
+
+async def get_secciones_by_evento(
+    db: AsyncSession,
+    id_evento: int,
+    limit: Optional[int] = None,
+    offset: int = 0
+):
     """
-    Obtiene todas las secciones de un evento específico.
+    Obtiene las secciones de un evento específico, paginadas y cacheadas en memoria.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
         id_evento (int): ID del evento.
+        limit (Optional[int]): Máximo de registros a retornar (None = sin límite).
+        offset (int): Registros a omitir.
 
     Returns:
-        List[Seccion]: Lista de secciones del evento.
+        List[Row]: Filas con las columnas de las secciones del evento.
     """
-    stmt = select(Seccion).where(Seccion.id_evento == id_evento)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    clave = ("evento", id_evento, limit, offset)
+    secciones = _secciones_cache.get(clave)
+    if secciones is None:
+        stmt = (
+            select(*_COLUMNAS_SECCION)
+            .where(Seccion.id_evento == id_evento)
+            .order_by(Seccion.id_seccion)
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await db.execute(stmt)
+        secciones = result.all()
+        _secciones_cache.set(clave, secciones)
+    return secciones
+
+async def get_secciones_by_eventos(
+    db: AsyncSession,
+    ids_evento: Iterable[int]
+) -> Dict[int, List[Row]]:
+    """
+    Obtiene las secciones de varios eventos en una sola consulta, agrupadas por evento.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos.
+        ids_evento (Iterable[int]): IDs de los eventos.
+
+    Returns:
+        Dict[int, List[Row]]: Secciones por ID de evento (lista vacía si no tiene).
+    """
+    agrupadas = {id_evento: [] for id_evento in ids_evento}
+    stmt = (
+        select(*_COLUMNAS_SECCION)
+        .where(Seccion.id_evento.in_(agrupadas))
+        .order_by(Seccion.id_evento, Seccion.id_seccion)
+    )
+    for seccion in await db.execute(stmt):
+        agrupadas[seccion.id_evento].append(seccion)
+    return agrupadas
 
 async def get_seccion(db: AsyncSession, id_seccion: int):
     """
-    Obtiene una sección por su ID.
+    Obtiene una sección por su ID. Solo se cachean las secciones encontradas.
+
+    Se cachea la fila con las columnas de `SeccionOut` y no la instancia ORM: una instancia
+    compartida entre sesiones queda expirada si la sesión que la cargó hace rollback.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
         id_seccion (int): ID de la sección a buscar.
 
     Returns:
-        Optional[Seccion]: La sección encontrada o None si no existe.
+        Optional[Row]: Fila con las columnas de la sección o None si no existe.
     """
-    stmt = select(Seccion).where(Seccion.id_seccion == id_seccion)
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+    clave = ("id", id_seccion)
+    seccion = _secciones_cache.get(clave)
+    if seccion is None:
+        stmt = select(*_COLUMNAS_SECCION).where(Seccion.id_seccion == id_seccion)
+        seccion = (await db.execute(stmt)).one_or_none()
+        if seccion is not None:
+            _secciones_cache.set(clave, seccion)
+    return seccion
+
+async def create_seccion_sin_commit(
+    db: AsyncSession,
+    id_evento: int,
+    nombre_seccion: str
+) -> Optional[Seccion]:
+    """
+    Inserta una sección en la transacción en curso, sin confirmarla.
+
+    El llamador confirma (p. ej. una vez para la sección y sus preguntas), hace rollback si
+    algo falla y, tras confirmar, llama a `invalidar_cache_secciones`.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos.
+        id_evento (int): ID del evento al que pertenece la sección.
+        nombre_seccion (str): Nombre de la sección.
+
+    Returns:
+        Optional[Seccion]: La sección creada, o None si ya existe una con ese nombre en el evento.
 
-async def create_seccion(db: AsyncSession, id_evento: int, nombre_seccion: str):
+    Raises:
+        IntegrityError: Si el evento no existe (violación de llave foránea).
     """
-    Crea una nueva sección.
+    stmt = (
+        pg_insert(Seccion)
+        .values(id_evento=id_evento, nombre_seccion=nombre_seccion)
+        .on_conflict_do_nothing(index_elements=["id_evento", "nombre_seccion"])
+        .returning(Seccion)
+    )
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+async def create_seccion(
+    db: AsyncSession,
+    id_evento: int,
+    nombre_seccion: str
+) -> Optional[Seccion]:
+    """
+    Crea una nueva sección con un único `INSERT ... ON CONFLICT DO NOTHING RETURNING`.
+
+    Un nombre repetido en el evento no inserta nada y retorna None, sin excepción ni rollback.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
@@ -63,16 +178,16 @@ async def create_seccion(db: AsyncSession, id_evento: int, nombre_seccion: str):
         nombre_seccion (str): Nombre de la sección.
 
     Returns:
-        Seccion: La sección creada.
+        Optional[Seccion]: La sección creada, o None si ya existe una con ese nombre en el evento.
 
     Raises:
-        IntegrityError: Si ya existe una sección con el mismo nombre en el evento.
+        IntegrityError: Si el evento no existe (violación de llave foránea).
     """
-    nueva_seccion = Seccion(id_evento=id_evento, nombre_seccion=nombre_seccion)
-    db.add(nueva_seccion)
     try:
-        await db.commit()
-        await db.refresh(nueva_seccion)
+        nueva_seccion = await create_seccion_sin_commit(db, id_evento, nombre_seccion)
+        await commit_asincrono(db)
+        if nueva_seccion is not None:
+            invalidar_cache_secciones()
         return nueva_seccion
     except IntegrityError:
         await db.rollback()
@@ -80,7 +195,7 @@ async def create_seccion(db: AsyncSession, id_evento: int, nombre_seccion: str):
 
 async def update_seccion(db: AsyncSession, id_seccion: int, nombre_seccion: str):
     """
-    Actualiza el nombre de una sección existente.
+    Actualiza el nombre de una sección existente con un único `UPDATE ... RETURNING`.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
@@ -93,26 +208,41 @@ async def update_seccion(db: AsyncSession, id_seccion: int, nombre_seccion: str)
     Raises:
         IntegrityError: Si ya existe otra sección con el mismo nombre en el evento.
     """
-    seccion = await get_seccion(db, id_seccion)
-    if not seccion:
-        return None
-    
-    seccion.nombre_seccion = nombre_seccion
+    stmt = (
+        update(Seccion)
+        .where(Seccion.id_seccion == id_seccion)
+        .values(nombre_seccion=nombre_seccion)
+        .returning(Seccion)
+    )
     try:
-        await db.commit()
-        await db.refresh(seccion)
+        seccion = (await db.execute(stmt)).scalar_one_or_none()
+        await commit_asincrono(db)
+        invalidar_cache_secciones()
         return seccion
     except IntegrityError:
         await db.rollback()
         raise
 
-async def delete_seccion(db: AsyncSession, seccion: Seccion):
+async def delete_seccion(db: AsyncSession, id_seccion: int) -> Optional[int]:
     """
-    Elimina una sección.
+    Elimina una sección en una sola sentencia `DELETE ... RETURNING`.
+
+    Sus preguntas y respuestas se eliminan por el `ON DELETE CASCADE` de la base de datos.
 
     Args:
         db (AsyncSession): Sesión de base de datos.
-        seccion (Seccion): Instancia de la sección a eliminar.
+        id_seccion (int): ID de la sección a eliminar.
+
+    Returns:
+        Optional[int]: El ID eliminado o None si la sección no existía.
     """
-    await db.delete(seccion)
-    await db.commit()
\ No newline at end of file
+    stmt = (
+        delete(Seccion)
+        .where(Seccion.id_seccion == id_seccion)
+        .returning(Seccion.id_seccion)
+    )
+    result = await db.execute(stmt)
+    eliminado = result.scalar_one_or_none()
+    await db.commit()
+    invalidar_cache_secciones()
+    return eliminado
\ No newline at end of file
@@ -1,11 +1,17 @@
+from typing import Optional
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.models.usuario import Usuario
-from app.services import participacion
 
-async def get_usuarios(db: AsyncSession):
-    result = await db.execute(select(Usuario))
-    return result.scalars().all()
+# Columnas de UsuarioOut: el listado devuelve filas (Row) sin instancias ORM
+_COLUMNAS_USUARIO = (Usuario.id_usuario, Usuario.cedula, Usuario.nombre)
+
+async def get_usuarios(db: AsyncSession, limit: Optional[int] = None, offset: int = 0):
+    stmt = select(*_COLUMNAS_USUARIO).order_by(Usuario.id_usuario).limit(limit).offset(offset)
+    result = await db.execute(stmt)
+    return result.all()
 
 async def get_usuario_by_cedula(db: AsyncSession, cedula: str):
     """
@@ -18,12 +24,13 @@ async def get_usuario_by_cedula(db: AsyncSession, cedula: str):
     Returns:
         Optional[Usuario]: El usuario encontrado o None si no existe
     """
-    result = await db.execute(select(Usuario).where(Usuario.cedula == cedula))
+    stmt = select(Usuario).where(Usuario.cedula == cedula)
+    result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 async def create_usuario(db: AsyncSession, cedula: str, nombre: str):
     """
-    Crea un nuevo usuario.
+    Crea un nuevo usuario con un único `INSERT ... ON CONFLICT DO NOTHING RETURNING`.
 
     Args:
         db (AsyncSession): Sesión de base de datos
@@ -31,46 +38,52 @@ async def create_usuario(db: AsyncSession, cedula: str, nombre: str):
         nombre (str): Nombre completo del usuario
 
     Returns:
-        Usuario: El usuario creado
-
-    Raises:
-        IntegrityError: Si ya existe un usuario con la misma cédula
+        Optional[Row]: Fila (id_usuario, cedula, nombre) del usuario creado, o None si ya
+            existe un usuario con la misma cédula
     """
-    usuario = Usuario(cedula=cedula, nombre=nombre)
-    try:
-        db.add(usuario)
-        await db.commit()
-        await db.refresh(usuario)
-        return usuario
-    except Exception:
-        await db.rollback()
-        raise
+    stmt = (
+        pg_insert(Usuario)
+        .values(cedula=cedula, nombre=nombre)
+        .on_conflict_do_nothing(index_elements=["cedula"])
+        .returning(*_COLUMNAS_USUARIO)
+    )
+    usuario = (await db.execute(stmt)).one_or_none()
+    await db.commit()
+    return usuario
 
-async def delete_usuario_by_cedula(db: AsyncSession, cedula: str):
+async def delete_usuario_by_cedula(db: AsyncSession, cedula: str) -> Optional[int]:
     """
-    Elimina todas las participaciones asociadas a un usuario y luego elimina al usuario.
+    Elimina un usuario y todas sus participaciones en una sola sentencia.
+
+    Usa `DELETE ... RETURNING`; las participaciones (y sus respuestas y resultados)
+    se eliminan por el `ON DELETE CASCADE` de la base de datos.
 
     Args:
         db (AsyncSession): Sesión de base de datos
         cedula (str): Número de cédula del usuario a eliminar
 
     Returns:
-        Optional[Usuario]: El usuario eliminado o None si no existía
+        Optional[int]: El ID del usuario eliminado o None si no existía
     """
-    usuario = await get_usuario_by_cedula(db, cedula)
-    if not usuario:
-        return None
-
-    # Eliminar participaciones primero (usando tu lógica existente)
-    participaciones = await participacion.get_participaciones_por_usuario_evento(db, cedula=cedula)
-    for p in participaciones:
-        await participacion.eliminar_participacion(db, p.id_participacion)
-
-    # Eliminar el usuario luego
-    await db.delete(usuario)
+    stmt = (
+        delete(Usuario)
+        .where(Usuario.cedula == cedula)
+        .returning(Usuario.id_usuario)
+    )
+    result = await db.execute(stmt)
+    eliminado = result.scalar_one_or_none()
     await db.commit()
-    return usuario
+    return eliminado
 
 async def delete_all_usuarios(db: AsyncSession):
-    await db.execute(select(Usuario).delete())
+    """
+    Elimina todos los usuarios con un único `DELETE FROM usuarios`.
+
+    Las participaciones se eliminan por el `ON DELETE CASCADE` de la base de datos. No se
+    sincroniza el identity map: la sesión es por request y no tiene usuarios cargados.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos
+    """
+    await db.execute(delete(Usuario).execution_options(synchronize_session=False))
     await db.commit()
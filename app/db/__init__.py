@@ -1,3 +1,3 @@
-from .connection import get_engine, get_db, async_session_maker, Base, engine
+from .connection import get_engine, get_pool_status, get_db, get_session_factory, get_read_session_factory, commit_asincrono, async_session_maker, async_read_session_maker, Base, engine
 
-__all__ = ['get_engine', 'get_db', 'async_session_maker', 'Base', 'engine']
\ No newline at end of file
+__all__ = ['get_engine', 'get_pool_status', 'get_db', 'get_session_factory', 'get_read_session_factory', 'commit_asincrono', 'async_session_maker', 'async_read_session_maker', 'Base', 'engine']
\ No newline at end of file
@@ -1,35 +1,101 @@
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+import orjson
+from sqlalchemy import text
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from dotenv import load_dotenv
-
-load_dotenv()
+from app.core.config import APP_ENV
 
 # Get database URL from environment variable
 DB_USER = os.getenv("POSTGRES_DB_USER")
 DB_PASSWORD = os.getenv("POSTGRES_DB_PASSWORD")
 DB_HOST = os.getenv("POSTGRES_DB_HOST")
-DB_PORT = int(os.getenv("POSTGRES_DB_PORT"))
+DB_PORT = int(os.getenv("POSTGRES_DB_PORT", "5432"))
 DB_NAME = os.getenv("POSTGRES_DB_NAME")
 
-DATABASE_URL = (
-    f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-    )
+# Pool de conexiones (ajustable por entorno)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# En prod se omite el SELECT 1 previo a cada checkout; pool_recycle acota las conexiones viejas
+DB_POOL_PRE_PING = os.getenv(
+    "DB_POOL_PRE_PING",
+    "false" if APP_ENV == "prod" else "true"
+).lower() == "true"
+
+# Réplica de lectura opcional para los listados (si no se define se usa el primario)
+DB_READ_HOST = os.getenv("POSTGRES_DB_READ_HOST")
+DB_READ_PORT = int(os.getenv("POSTGRES_DB_READ_PORT", DB_PORT))
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "40"))
 
-print(f"Connecting to database at {DATABASE_URL}")
+# Cachés de sentencias: SQL compilado por SQLAlchemy (por motor) y sentencias preparadas
+# de asyncpg (por conexión), para no repetir compilación ni parse/plan en cada request
+DB_QUERY_CACHE_SIZE = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
+DB_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "512"))
+# JIT de PostgreSQL desactivado por defecto: las consultas de la API son cortas y compilar
+# el plan cuesta más de lo que ahorra cuando el costo estimado supera el umbral de JIT
+DB_JIT = os.getenv("DB_JIT", "off")
+# Nombre con el que aparecen las conexiones en pg_stat_activity y en los logs del servidor
+DB_APPLICATION_NAME = os.getenv("DB_APPLICATION_NAME", "trivia_api")
+
+# Argumentos de conexión de asyncpg compartidos por ambos motores
+DB_CONNECT_ARGS = {
+    "prepared_statement_cache_size": DB_PREPARED_STATEMENT_CACHE_SIZE,
+    "server_settings": {"jit": DB_JIT, "application_name": DB_APPLICATION_NAME}
+}
+
+# URL.create escapa usuario y contraseña (caracteres como @, : o / no rompen la URL)
+DATABASE_URL = URL.create(
+    "postgresql+asyncpg",
+    username=DB_USER,
+    password=DB_PASSWORD,
+    host=DB_HOST,
+    port=DB_PORT,
+    database=DB_NAME
+)
+
+def _json_serializer(obj) -> str:
+    """Serializa valores JSON/JSONB con orjson (SQLAlchemy espera un str)."""
+    return orjson.dumps(obj).decode()
 
 # Create async engine
 engine = create_async_engine(
     DATABASE_URL,
-    echo=False,                # True solo en desarrollo
-    future=True,               # API moderna
-    pool_pre_ping=True,        # Verifica conexiones
-    pool_size=20,              # Pool base
-    max_overflow=10,           # Extra en carga pico
-    pool_recycle=1800          # Evita timeouts
+    echo=False,                        # True solo en desarrollo
+    future=True,                       # API moderna
+    pool_pre_ping=DB_POOL_PRE_PING,    # Verifica conexiones (desactivado en prod)
+    pool_size=DB_POOL_SIZE,            # Pool base
+    max_overflow=DB_MAX_OVERFLOW,      # Extra en carga pico
+    pool_recycle=DB_POOL_RECYCLE,      # Evita timeouts
+    pool_use_lifo=True,                # Reutiliza las conexiones más recientes
+    query_cache_size=DB_QUERY_CACHE_SIZE,  # SQL compilado reutilizable
+    json_serializer=_json_serializer,  # JSONB con orjson al escribir
+    json_deserializer=orjson.loads,    # y en el codec de asyncpg al leer
+    connect_args=DB_CONNECT_ARGS
 )
 
+# Create read-only engine: réplica si está configurada, si no comparte el pool primario
+if DB_READ_HOST:
+    read_engine = create_async_engine(
+        DATABASE_URL.set(host=DB_READ_HOST, port=DB_READ_PORT),
+        echo=False,
+        future=True,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        pool_size=DB_READ_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_use_lifo=True,
+        query_cache_size=DB_QUERY_CACHE_SIZE,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        connect_args=DB_CONNECT_ARGS
+    )
+else:
+    read_engine = engine
+
+# Las transacciones de lectura se abren como READ ONLY
+read_engine = read_engine.execution_options(postgresql_readonly=True)
+
 def get_engine():
     """
     Retorna la instancia única del motor asíncrono de SQLAlchemy.
@@ -39,13 +105,78 @@ def get_engine():
     """
     return engine
 
+def get_pool_status() -> dict:
+    """
+    Retorna métricas básicas del pool de conexiones para monitoreo.
+
+    Returns:
+        dict: Tamaño del pool, conexiones en uso, libres y en overflow.
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+    }
+
 # Create async session factory
-async_session_maker = sessionmaker(
+# Sin autoflush: las escrituras se confirman con commit o flush explícito, y las consultas
+# no recorren el conjunto de objetos modificados antes de ejecutarse
+async_session_maker = async_sessionmaker(
     engine,
-    class_=AsyncSession,
-    expire_on_commit=False
+    expire_on_commit=False,
+    autoflush=False
 )
 
+async def get_session_factory():
+    """
+    Dependencia de FastAPI que entrega la fábrica de sesiones asíncronas.
+
+    A diferencia de `get_db`, el handler abre la sesión con `async with factory() as db:`
+    y la conexión vuelve al pool al salir del bloque, antes de serializar la respuesta.
+
+    Returns:
+        async_sessionmaker: Fábrica configurada para crear sesiones `AsyncSession`.
+    """
+    return async_session_maker
+
+# Create read-only session factory
+async_read_session_maker = async_sessionmaker(
+    read_engine,
+    expire_on_commit=False,
+    autoflush=False
+)
+
+async def get_read_session_factory():
+    """
+    Dependencia de FastAPI que entrega la fábrica de sesiones de solo lectura.
+
+    Las sesiones usan la réplica definida en `POSTGRES_DB_READ_HOST` o, si no existe,
+    el motor primario con transacciones `READ ONLY`. Solo debe usarse en endpoints de consulta.
+
+    Returns:
+        async_sessionmaker: Fábrica configurada para crear sesiones `AsyncSession` de solo lectura.
+    """
+    return async_read_session_maker
+
+# Confirmación sin esperar el fsync del WAL, válida solo para la transacción en curso
+_COMMIT_ASINCRONO = text("SET LOCAL synchronous_commit = off")
+
+async def commit_asincrono(session: AsyncSession) -> None:
+    """
+    Confirma la transacción sin esperar a que el WAL se escriba a disco.
+
+    Para escrituras de catálogo (secciones, grupos, preguntas) donde perder los últimos
+    milisegundos ante una caída del servidor es aceptable: no hay riesgo de corrupción,
+    solo de perder transacciones recién confirmadas. No usar para participaciones.
+
+    Args:
+        session (AsyncSession): Sesión con la transacción a confirmar.
+    """
+    await session.execute(_COMMIT_ASINCRONO)
+    await session.commit()
+
 # Create declarative base
 Base = declarative_base()
 
@@ -1,9 +1,9 @@
 """Inicializa las tablas, funciones y triggers para el esquema 'trivia'."""
-import os
 from sqlalchemy.ext.asyncio import AsyncEngine  # Terceros
 from sqlalchemy import text
 from app.db import get_engine  # Proyecto propio
 from app.models import Base
+from app.core.config import APP_ENV
 
 async def init_models(engine: AsyncEngine):
     """
@@ -15,32 +15,61 @@ async def init_models(engine: AsyncEngine):
     Args:
         engine (AsyncEngine): Motor asincrónico de SQLAlchemy conectado a la base de datos.
     """
+    # Configurar los mappers ahora y no en la primera consulta ORM de un request
+    Base.registry.configure()
+
     async with engine.begin() as conn:
         # Siempre crear esquema y tablas
         await conn.execute(text("CREATE SCHEMA IF NOT EXISTS trivia"))
         await conn.run_sync(Base.metadata.create_all)
 
         # Solo en entorno que no sea producción
-        env = os.getenv("APP_ENV", "dev")
-        if env != "prod":
+        if APP_ENV != "prod":
             await conn.execute(text("SET search_path = trivia, public"))
             await run_sql_scripts(conn, [
+                    "app/sql/drop_function_gestionar_participacion.sql",
                     "app/sql/create_function_gestionar_participacion.sql",
                     "app/sql/create_function_trg_participacion_finalizada.sql",
                     "app/sql/drop_trigger_participacion.sql",
-                    "app/sql/create_trigger_participacion.sql"
+                    "app/sql/alter_participaciones_estado_texto.sql",
+                    "app/sql/create_trigger_participacion.sql",
+                    "app/sql/create_index_eventos_nombre_lower.sql",
+                    "app/sql/create_index_grupos_fecha_inicio_id.sql",
+                    "app/sql/create_index_grupos_evento_fecha_inicio_id.sql",
+                    "app/sql/create_index_grupos_vigencia.sql",
+                    "app/sql/create_index_participaciones_grupo_usuario_estado.sql",
+                    "app/sql/create_index_participaciones_pendientes.sql",
+                    "app/sql/create_index_participaciones_started_brin.sql",
+                    "app/sql/create_index_participaciones_grupo_started.sql",
+                    "app/sql/create_index_participaciones_usuario_started.sql",
+                    "app/sql/create_index_respuestas_usuarios_id_pregunta.sql",
+                    "app/sql/create_index_resultados_ranking.sql",
+                    "app/sql/alter_respuestas_orden_smallint.sql"
                 ])
 
 async def run_sql_scripts(conn, script_paths):
     """
-    Ejecuta scripts SQL individuales, uno por sentencia, para compatibilidad con asyncpg.
-    """
+    Ejecuta los scripts SQL en orden en un solo viaje a la base de datos.
+
+    Los scripts se concatenan y se envían por la conexión asyncpg subyacente, cuyo
+    `execute` sin parámetros usa el protocolo simple y admite varias sentencias.
+    Las sentencias corren en el orden de `script_paths` dentro de la transacción abierta.
 
+    Args:
+        conn (AsyncConnection): Conexión con la transacción de inicialización.
+        script_paths (list[str]): Rutas de los scripts, en orden de ejecución.
+    """
+    sentencias = []
     for path in script_paths:
         with open(path, "r", encoding="utf-8") as f:
-            sql = f.read().strip()
+            sql = f.read().strip().rstrip(";")
             if sql:
-                await conn.execute(text(sql))
+                sentencias.append(sql)
+    if not sentencias:
+        return
+
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.execute(";\n".join(sentencias) + ";")
 
 async def init():
     """Función externa para lanzar la inicialización de base de datos."""
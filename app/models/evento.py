@@ -6,12 +6,12 @@ que determina cómo los usuarios se autentican en el frontend.
 
 Este modelo incluye:
 - Clave primaria `id_evento`
-- Nombre único del evento
+- Nombre único del evento (índice único sobre `lower(nombre_evento)`)
 - Tipo de login (ENUM PostgreSQL: generico, localidad)
 """
 
 import enum
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Index, func
 from sqlalchemy import Enum as PgEnum
 from app.db.connection import Base
 
@@ -60,4 +60,7 @@ class Evento(Base):
         nullable=False,
         default=TipoLogin.generico,
         doc="Tipo de autenticación habilitada para el evento"
-    )
\ No newline at end of file
+    )
+
+# Unicidad del nombre sin distinguir mayúsculas (respaldo de get_by_nombre y create_evento)
+Index("uq_eventos_nombre_lower", func.lower(Evento.nombre_evento), unique=True)
@@ -3,7 +3,7 @@ from sqlalchemy import (
     Column, Integer, String, ForeignKey, TIMESTAMP,
     SmallInteger, Interval
 )
-from sqlalchemy import (CheckConstraint, UniqueConstraint)
+from sqlalchemy import (CheckConstraint, UniqueConstraint, Index, func, literal_column)
 from sqlalchemy.orm import relationship
 from app.db.connection import Base
 
@@ -14,6 +14,9 @@ class Grupo(Base):
         CheckConstraint("fecha_cierre > fecha_inicio", name="ck_fecha"),
         CheckConstraint("max_intentos > 0", name="ck_max_intentos"),
         CheckConstraint("cooldown >= interval '0 seconds'", name="ck_cooldown"),
+        # Orden de los listados; permiten paginar por cursor (fecha_inicio, id_grupo)
+        Index("ix_grupos_fecha_inicio_id", "fecha_inicio", "id_grupo"),
+        Index("ix_grupos_evento_fecha_inicio_id", "id_evento", "fecha_inicio", "id_grupo"),
         {"schema": "trivia"}
     )
 
@@ -40,3 +43,9 @@ class Grupo(Base):
         cascade="all, delete-orphan",
         passive_deletes=True
     )
+
+# Vigencia del grupo como rango cerrado. Los límites '[]' van en línea (no como parámetro)
+# para que la consulta `vigencia @> fecha` coincida con la expresión del índice GiST
+VIGENCIA_GRUPO = func.tstzrange(Grupo.fecha_inicio, Grupo.fecha_cierre, literal_column("'[]'"))
+
+Index("idx_grupo_activo", VIGENCIA_GRUPO, postgresql_using="gist")
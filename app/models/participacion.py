@@ -6,17 +6,22 @@ las participaciones relacionadas se eliminan automáticamente (ON DELETE CASCADE
 """
 import enum
 from sqlalchemy import (
-    Column, Integer, ForeignKey, Enum as PgEnum, TIMESTAMP,
-    Interval, SmallInteger, UniqueConstraint
+    Column, Integer, String, ForeignKey, TIMESTAMP,
+    Interval, SmallInteger, UniqueConstraint, CheckConstraint, Index, text
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from app.db.connection import Base
 
 TRIVIA_SCHEMA = "trivia"
 
 class EstadoParticipacion(str, enum.Enum):
-    """Enum para el estado de una participación."""
+    """
+    Enum para el estado de una participación.
+
+    En la base de datos el estado es texto validado con un CHECK (no un tipo ENUM de
+    PostgreSQL, que asyncpg debe introspectar en cada conexión nueva).
+    """
     pendiente = "pendiente"
     finalizado = "finalizado"
 
@@ -42,6 +47,32 @@ class Participacion(Base):
     __tablename__ = "participaciones"
     __table_args__ = (
         UniqueConstraint("id_usuario", "id_grupo", "numero_intento", name="uq_usuario_grupo_intento"),
+        CheckConstraint("estado IN ('pendiente', 'finalizado')", name="ck_estado_participacion"),
+        # Consultas por grupo (ranking, listados por grupo/estado): el INCLUDE las resuelve
+        # con un recorrido solo de índice, sin leer las filas de la tabla
+        Index(
+            "ix_participaciones_grupo_usuario_estado",
+            "id_grupo", "id_usuario", "estado",
+            postgresql_include=["id_participacion", "numero_intento", "finished_at", "tiempo_total"]
+        ),
+        # Intentos en curso (reanudar / validar intentos): solo indexa las filas pendientes
+        Index(
+            "ix_participaciones_pendientes",
+            "id_usuario", "id_grupo",
+            postgresql_where=text("estado = 'pendiente'")
+        ),
+        # Listados por grupo y por usuario (cédula), ordenados por started_at DESC: el
+        # LIMIT de la página se resuelve recorriendo el índice, sin ordenar todo el grupo
+        Index("ix_participaciones_grupo_started", "id_grupo", text("started_at DESC")),
+        Index("ix_participaciones_usuario_started", "id_usuario", text("started_at DESC")),
+        # Filtros por rango de fechas (analítica): BRIN ocupa unas pocas páginas y casi no
+        # encarece las inserciones, porque started_at crece con el orden de inserción
+        Index(
+            "ix_participaciones_started_brin",
+            "started_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
         {"schema": TRIVIA_SCHEMA}
     )
 
@@ -57,29 +88,32 @@ class Participacion(Base):
         nullable=False
     )
     numero_intento = Column(SmallInteger, nullable=False, default=1)
-    respuestas_usuario = Column(JSONB, nullable=False)
-    respuestas_abiertas = Column(JSONB, nullable=True)
+    # Copia de lo enviado al finalizar; el puntaje sale de `respuestas_usuarios`. Las columnas
+    # JSONB no se cargan con la participación salvo que una consulta las pida (`undefer`)
+    respuestas_usuario = deferred(Column(JSONB, nullable=False))
+    respuestas_abiertas = deferred(Column(JSONB, nullable=True))
     estado = Column(
-        PgEnum(EstadoParticipacion, name="estado_participacion", schema=TRIVIA_SCHEMA),
+        String(12),
         nullable=False,
-        default=EstadoParticipacion.pendiente
+        default=EstadoParticipacion.pendiente.value
     )
     started_at = Column(TIMESTAMP(timezone=True), nullable=False)
     finished_at = Column(TIMESTAMP(timezone=True), nullable=True)
     tiempo_total = Column(Interval, nullable=True)
 
-    # Relaciones
+    # Relaciones: no se cargan por defecto; las consultas que las necesitan las piden
+    # explícitamente (p. ej. `joinedload(Participacion.usuario)`)
     grupo = relationship(
         "Grupo",
         back_populates="participaciones",
-        lazy="joined",
+        lazy="raise",
         passive_deletes=True
     )
 
     usuario = relationship(
         "Usuario",
         back_populates="participaciones",
-        lazy="joined",
+        lazy="raise",
         passive_deletes=True
     )
     
\ No newline at end of file
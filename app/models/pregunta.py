@@ -23,10 +23,12 @@ class Pregunta(Base):
         "Respuesta", 
         back_populates="pregunta", 
         cascade="all, delete-orphan",
-        lazy="selectin"
+        passive_deletes=True,  # El borrado lo resuelve el ON DELETE CASCADE de la base de datos
+        lazy="raise_on_sql",  # Las consultas piden `selectinload` explícitamente
+        order_by=Respuesta.orden  # La base de datos entrega las respuestas ya ordenadas
     )
     
     seccion: Mapped["Seccion"] = relationship(
         "Seccion",
-        lazy="selectin"
+        lazy="raise_on_sql"
     )
@@ -1,6 +1,6 @@
 """ Modelo ORM para la tabla `respuestas` en el esquema `trivia`. """
 
-from sqlalchemy import Column, Integer, ForeignKey, Text, CheckConstraint, UniqueConstraint
+from sqlalchemy import Column, Integer, SmallInteger, ForeignKey, Text, CheckConstraint, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.db.connection import Base
 
@@ -39,7 +39,7 @@ class Respuesta(Base):
 
     id_respuesta = Column(Integer, primary_key=True, index=True)
     id_pregunta = Column(Integer, ForeignKey("trivia.preguntas.id_pregunta", ondelete="CASCADE"), nullable=False)
-    orden = Column(Integer, nullable=False)
+    orden = Column(SmallInteger, nullable=False)  # Mismo tipo que opcion_correcta y orden_seleccionado
     respuesta = Column(Text, nullable=False)
 
     # Relación bidireccional con Pregunta
@@ -7,7 +7,7 @@ permitiendo respuestas independientes incluso si el usuario participa varias vec
 La eliminación en cascada permite que al eliminar una participación, se borren automáticamente sus respuestas.
 """
 
-from sqlalchemy import Column, Integer, SmallInteger, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, SmallInteger, ForeignKey, UniqueConstraint, Index
 from app.db.connection import Base
 
 class RespuestaUsuario(Base):
@@ -22,6 +22,9 @@ class RespuestaUsuario(Base):
     __tablename__ = "respuestas_usuarios"
     __table_args__ = (
         UniqueConstraint("id_participacion", "id_pregunta", name="uq_participacion_pregunta"),
+        # El ON DELETE CASCADE desde preguntas busca por id_pregunta (el único empieza por
+        # id_participacion y no sirve para esa búsqueda)
+        Index("ix_respuestas_usuarios_id_pregunta", "id_pregunta"),
         {"schema": "trivia"}
     )
 
@@ -5,7 +5,7 @@ Cada registro está vinculado a una única `participación` y se calcula automá
 cuando la participación cambia a estado `finalizado` mediante un trigger.
 """
 
-from sqlalchemy import Column, Integer, ForeignKey, Interval, Numeric, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, Interval, Numeric, UniqueConstraint, Index, text
 from app.db.connection import Base
 
 class Resultado(Base):
@@ -19,6 +19,13 @@ class Resultado(Base):
     __tablename__ = "resultados"
     __table_args__ = (
         UniqueConstraint("id_participacion", name="uq_resultado_participacion"),
+        # Ranking: filas ya en el orden del ORDER BY (más aciertos, menos tiempo), con lo
+        # necesario para el JOIN incluido en el índice
+        Index(
+            "ix_resultados_ranking",
+            text("respuestas_correctas DESC"), "tiempo_total",
+            postgresql_include=["id_participacion", "total_preguntas"]
+        ),
         {"schema": "trivia"}
     )
 
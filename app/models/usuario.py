@@ -54,10 +54,13 @@ class Usuario(Base):
         doc="Nombre completo del usuario"
     )
 
-    # Relaciones
+    # Relaciones: la colección no se carga (lazy="raise") y el ORM nunca borra ni anula las
+    # participaciones al eliminar un usuario (passive_deletes="all"); lo hace el
+    # ON DELETE CASCADE de la llave foránea en una sola sentencia
     participaciones = relationship(
         "Participacion",
         back_populates="usuario",
-        passive_deletes=True,
-        lazy="selectin"
+        cascade="save-update, merge",
+        passive_deletes="all",
+        lazy="raise"
     )
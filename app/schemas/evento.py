@@ -7,7 +7,7 @@ Contiene la clase `EventoCreate` que valida el campo `nombre_evento`:
 - Documenta la intención del campo para la interfaz Swagger/OpenAPI.
 """
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 from enum import Enum
 
 class TipoLogin(str, Enum):
@@ -60,5 +60,4 @@ class EventoOut(BaseModel):
     nombre_evento: str
     tipo_login: TipoLogin
 
-    class Config:
-        orm_mode = True  # Habilita compatibilidad con SQLAlchemy
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)  # Habilita compatibilidad con SQLAlchemy
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ConfigDict
 
 class RankingUsuarioOut(BaseModel):
     ranking: int = Field(..., description="Posición en el ranking (1 = mejor puntuación)")
@@ -9,9 +9,9 @@ class RankingUsuarioOut(BaseModel):
     total_preguntas: int = Field(..., description="Cantidad total de preguntas respondidas")
     respuestas_correctas: int = Field(..., description="Número de respuestas correctas")
 
-    class Config:
-        orm_mode = True
-        schema_extra = {
+    model_config = ConfigDict(
+        from_attributes=True,
+        json_schema_extra={
             "example": {
                 "ranking": 1,
                 "cedula": "1234567890",
@@ -21,4 +21,5 @@ class RankingUsuarioOut(BaseModel):
                 "total_preguntas": 10,
                 "respuestas_correctas": 9
             }
-        }
\ No newline at end of file
+        }
+    )
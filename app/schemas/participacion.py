@@ -6,8 +6,9 @@ relacionados con la gestión de participaciones de usuarios en eventos.
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Optional, List, Any
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict, PrivateAttr, TypeAdapter
+from app.schemas.usuario import normalizar_nombre, validar_formato_cedula
 
 class GestionarParticipacionRequest(BaseModel):
     """
@@ -27,19 +28,16 @@ class GestionarParticipacionRequest(BaseModel):
     @classmethod
     def validar_nombre(cls, v: str) -> str:
         """Valida que el nombre no esté vacío después de quitar espacios"""
-        v = v.strip()
+        v = normalizar_nombre(v)
         if not v:
             raise ValueError("El nombre no puede estar vacío")
-        return v.title()
+        return v
 
     @field_validator("cedula")
     @classmethod
     def validar_cedula(cls, v: str) -> str:
         """Valida que la cédula solo contenga números"""
-        v = v.strip()
-        if not v.isdigit():
-            raise ValueError("La cédula debe contener solo números")
-        return v
+        return validar_formato_cedula(v)
 
 class RespuestaUsuario(BaseModel):
     """
@@ -64,6 +62,9 @@ class RespuestaUsuario(BaseModel):
         }
     )
 
+# Serializador/validador de listas de respuestas, construido una sola vez al importar
+RESPUESTAS_ADAPTER = TypeAdapter(List[RespuestaUsuario])
+
 class FinalizarParticipacionRequest(BaseModel):
     """
     Esquema de entrada para finalizar una participación.
@@ -74,17 +75,38 @@ class FinalizarParticipacionRequest(BaseModel):
         tiempo (str): Tiempo total en formato 'HH:MM:SS'
     """
     id_participacion: int = Field(..., gt=0)
-    respuestas: List[RespuestaUsuario]
-    tiempo: str = Field(..., pattern=r'^\d{2}:\d{2}:\d{2}$')
+    respuestas: List[RespuestaUsuario] = Field(..., min_length=1)
+    tiempo: str = Field(..., min_length=8, max_length=8, description="Tiempo total en formato 'HH:MM:SS'")
 
-    @field_validator("respuestas")
+    # Segundos totales de `tiempo`, calculados una vez al validar (no forman parte del esquema)
+    _tiempo_segundos: int = PrivateAttr(default=0)
+
+    @field_validator("tiempo")
     @classmethod
-    def validar_respuestas(cls, v: List[RespuestaUsuario]) -> List[RespuestaUsuario]:
-        """Valida que haya al menos una respuesta"""
-        if not v:
-            raise ValueError("Debe proporcionar al menos una respuesta")
+    def validar_tiempo(cls, v: str) -> str:
+        """Valida el formato 'HH:MM:SS' con comparaciones directas (longitud ya fijada en 8)"""
+        if not (
+            v[2] == ":" and v[5] == ":" and v.isascii()
+            and v[:2].isdigit() and v[3:5].isdigit() and v[6:].isdigit()
+        ):
+            raise ValueError("El tiempo debe tener el formato HH:MM:SS")
         return v
 
+    @model_validator(mode="after")
+    def calcular_tiempo_segundos(self) -> "FinalizarParticipacionRequest":
+        """Convierte `tiempo` a segundos a partir de los códigos ASCII de cada dígito"""
+        v = self.tiempo
+        horas = (ord(v[0]) - 48) * 10 + ord(v[1]) - 48
+        minutos = (ord(v[3]) - 48) * 10 + ord(v[4]) - 48
+        segundos = (ord(v[6]) - 48) * 10 + ord(v[7]) - 48
+        self._tiempo_segundos = horas * 3600 + minutos * 60 + segundos
+        return self
+
+    @property
+    def duracion(self) -> timedelta:
+        """Tiempo total como `timedelta`, sin volver a parsear la cadena"""
+        return timedelta(seconds=self._tiempo_segundos)
+
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -113,7 +135,7 @@ class ParticipacionResponse(BaseModel):
     Attributes:
         action (str): Acción realizada ("iniciar", "continuar", "esperar" o "finalizado")
         id_participacion (int): ID de la participación
-        respuestas (List[Dict]): Lista de respuestas del usuario
+        respuestas (List[RespuestaUsuario]): Respuestas guardadas al finalizar el intento
         started_at (datetime): Timestamp de inicio
         tiempo_total (Optional[str]): Tiempo total transcurrido
     """
@@ -121,18 +143,13 @@ class ParticipacionResponse(BaseModel):
     action          : str
     id_participacion: int
     numero_intento  : int
-    respuestas      : List[Dict[str, Any]]
+    respuestas      : List[RespuestaUsuario]
     started_at      : datetime
     finished_at     : Optional[datetime] = None
     tiempo_total    : Optional[str]     = None
     remaining       : str
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        json_encoders={
-            datetime: lambda v: v.isoformat()
-        }
-    )
+    model_config = ConfigDict(from_attributes=True)
 
 class UsuarioInfo(BaseModel):
     """
@@ -169,18 +186,26 @@ class ParticipacionOut(BaseModel):
         if v is None:
             return None
         if isinstance(v, timedelta):
-            return f"{int(v.total_seconds() // 3600):02d}:{int((v.total_seconds() % 3600) // 60):02d}:{int(v.total_seconds() % 60):02d}"
+            # El interval de la base tiene resolución de segundos: se usan los atributos
+            # enteros del timedelta en lugar de total_seconds() (float)
+            horas, segundos = divmod(v.days * 86400 + v.seconds, 3600)
+            minutos, segundos = divmod(segundos, 60)
+            return f"{horas:02d}:{minutos:02d}:{segundos:02d}"
         return v
 
     model_config = ConfigDict(from_attributes=True)
 
 class ListarParticipacionesResponse(BaseModel):
     """
-    Esquema de respuesta para listar participaciones.
+    Esquema de respuesta para listar participaciones de forma paginada.
     
     Attributes:
-        participaciones (List[ParticipacionOut]): Lista de participaciones
-        total (int): Número total de participaciones
+        participaciones (List[ParticipacionOut]): Página de participaciones
+        total (int): Número total de participaciones que cumplen los filtros
+        limit (int): Tamaño máximo de la página solicitada
+        offset (int): Número de participaciones omitidas
     """
     participaciones: List[ParticipacionOut]
-    total: int
\ No newline at end of file
+    total: int
+    limit: int
+    offset: int
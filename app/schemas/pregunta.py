@@ -6,8 +6,8 @@ Contiene las clases `PreguntaCreate` y `PreguntaOut` que validan y representan l
 - PreguntaOut: Para la respuesta de la API
 """
 
-from typing import Optional, List
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Iterable, Optional, List
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
 
 class RespuestaBase(BaseModel):
     """
@@ -16,6 +16,25 @@ class RespuestaBase(BaseModel):
     respuesta: str = Field(..., min_length=1, description="Texto de la respuesta")
     orden: int = Field(..., gt=0, le=4, description="Orden de la respuesta (1-4)")
 
+def ordenes_consecutivos(respuestas: Iterable[RespuestaBase], total: int) -> bool:
+    """
+    Indica si los órdenes de las respuestas son 1..total, sin repetir ni saltar números.
+
+    Se enciende el bit (orden - 1) por cada respuesta: el conjunto es exactamente 1..total
+    solo si quedan encendidos los `total` bits bajos.
+
+    Args:
+        respuestas (Iterable[RespuestaBase]): Respuestas con su `orden` ya validado (1-4).
+        total (int): Número de respuestas.
+
+    Returns:
+        bool: True si los órdenes son consecutivos empezando desde 1.
+    """
+    mascara = 0
+    for r in respuestas:
+        mascara |= 1 << (r.orden - 1)
+    return mascara == (1 << total) - 1
+
 class RespuestaCreate(RespuestaBase):
     """Esquema para crear una respuesta"""
     model_config = ConfigDict(from_attributes=True)
@@ -58,35 +77,32 @@ class PreguntaCreate(BaseModel):
             raise ValueError("El tipo de pregunta debe ser 'abierta' o 'opcion_unica'")
         return value
 
-    @field_validator("respuestas")
-    @classmethod
-    def validar_respuestas(cls, respuestas: Optional[List[RespuestaCreate]], info) -> Optional[List[RespuestaCreate]]:
-        tipo = info.data.get("tipo_pregunta")
-        if tipo == "opcion_unica":
+    @model_validator(mode="after")
+    def validar_segun_tipo(self) -> "PreguntaCreate":
+        """
+        Valida las respuestas y la opción correcta según el tipo de pregunta.
+
+        Se ejecuta una sola vez con todos los campos ya validados, leyendo los atributos
+        del modelo en lugar del diccionario parcial `info.data`.
+        """
+        respuestas = self.respuestas
+        opcion = self.opcion_correcta
+        if self.tipo_pregunta == "opcion_unica":
             if not respuestas or not (1 <= len(respuestas) <= 4):
                 raise ValueError("Debe haber entre 1 y 4 respuestas para preguntas de opción única")
-            ordenes = [r.orden for r in respuestas]
-            if sorted(ordenes) != list(range(1, len(respuestas) + 1)):
+            total = len(respuestas)
+            if not ordenes_consecutivos(respuestas, total):
                 raise ValueError("Los órdenes de las respuestas deben ser números consecutivos empezando desde 1")
-        elif tipo == "abierta":
-            if respuestas:
-                raise ValueError("Las preguntas abiertas no deben tener respuestas")
-        return respuestas
-
-    @field_validator("opcion_correcta")
-    @classmethod
-    def validar_opcion_correcta(cls, opcion: Optional[int], info) -> Optional[int]:
-        tipo = info.data.get("tipo_pregunta")
-        respuestas = info.data.get("respuestas", [])
-        if tipo == "opcion_unica":
             if opcion is None:
                 raise ValueError("Debes indicar la opción correcta para preguntas de opción única")
-            if respuestas and opcion not in [r.orden for r in respuestas]:
+            if not 1 <= opcion <= total:
                 raise ValueError("La opción correcta debe corresponder al orden de una de las respuestas")
-        elif tipo == "abierta":
+        else:
+            if respuestas:
+                raise ValueError("Las preguntas abiertas no deben tener respuestas")
             if opcion is not None:
                 raise ValueError("Las preguntas abiertas no deben tener opción correcta")
-        return opcion
+        return self
 
 class SeccionInfo(BaseModel):
     """Información básica de una sección"""
@@ -6,7 +6,29 @@ Contiene las clases `SeccionCreate` y `SeccionOut` que validan y representan las
 - SeccionOut: Para la respuesta de la API
 """
 
-from pydantic import BaseModel, Field, field_validator
+import re
+from functools import lru_cache
+from pydantic import BaseModel, Field, field_validator, ConfigDict
+
+# Palabra = secuencia de letras/dígitos Unicode (incluye tildes y ñ)
+_PALABRA_RE = re.compile(r"\w+")
+
+@lru_cache(maxsize=1024)
+def formatear_titulo(value: str) -> str:
+    """
+    Convierte un nombre a formato título poniendo en mayúscula la primera letra de cada palabra.
+
+    A diferencia de `str.title()`, una palabra que empieza por dígito no se altera
+    ("2do Nivel" se mantiene, no pasa a "2Do Nivel"). Los nombres de sección se repiten
+    mucho, por eso el resultado se memoriza.
+
+    Args:
+        value (str): Texto ya sin espacios iniciales ni finales.
+
+    Returns:
+        str: Texto en formato título.
+    """
+    return _PALABRA_RE.sub(lambda m: m.group(0).capitalize(), value)
 
 class SeccionCreate(BaseModel):
     """
@@ -41,7 +63,7 @@ class SeccionCreate(BaseModel):
         value = value.strip()
         if not value:
             raise ValueError("El nombre de la sección no puede estar vacío")
-        return value.title()
+        return formatear_titulo(value)
 
 class SeccionOut(BaseModel):
     """
@@ -56,5 +78,4 @@ class SeccionOut(BaseModel):
     id_evento: int
     nombre_seccion: str
 
-    class Config:
-        from_attributes = True  # Para compatibilidad con SQLAlchemy
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)  # Para compatibilidad con SQLAlchemy
\ No newline at end of file
@@ -5,8 +5,48 @@ Define los modelos Pydantic para validar los datos de entrada y salida
 relacionados con los usuarios.
 """
 
+import re
+from functools import lru_cache
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+# Solo dígitos ASCII (`str.isdigit` también acepta dígitos Unicode como "²" o "٣")
+_CEDULA_RE = re.compile(r"[0-9]+")
+
+@lru_cache(maxsize=4096)
+def normalizar_nombre(value: str) -> str:
+    """
+    Quita los espacios de los extremos y convierte el nombre a formato título.
+
+    El mismo usuario envía su nombre en cada ingreso, por eso el resultado se memoriza.
+
+    Args:
+        value (str): Nombre tal como llega en la petición.
+
+    Returns:
+        str: Nombre normalizado (vacío si solo tenía espacios).
+    """
+    return value.strip().title()
+
+def validar_formato_cedula(value: str) -> str:
+    """
+    Quita los espacios de los extremos y verifica que la cédula solo tenga dígitos ASCII.
+
+    Compartida por todos los esquemas que reciben una cédula, para que la regla sea una sola.
+
+    Args:
+        value (str): Cédula tal como llega en la petición.
+
+    Returns:
+        str: Cédula sin espacios.
+
+    Raises:
+        ValueError: Si contiene caracteres que no son dígitos.
+    """
+    value = value.strip()
+    if not _CEDULA_RE.fullmatch(value):
+        raise ValueError("La cédula debe contener solo números")
+    return value
+
 class UsuarioBase(BaseModel):
     """
     Esquema base para los usuarios.
@@ -22,19 +62,16 @@ class UsuarioBase(BaseModel):
     @classmethod
     def validar_cedula(cls, v: str) -> str:
         """Valida que la cédula solo contenga números"""
-        v = v.strip()
-        if not v.isdigit():
-            raise ValueError("La cédula debe contener solo números")
-        return v
+        return validar_formato_cedula(v)
 
     @field_validator("nombre")
     @classmethod
     def validar_nombre(cls, v: str) -> str:
         """Valida que el nombre no esté vacío y lo convierte a formato título"""
-        v = v.strip()
+        v = normalizar_nombre(v)
         if not v:
             raise ValueError("El nombre no puede estar vacío")
-        return v.title()
+        return v
 
 class UsuarioCreate(UsuarioBase):
     """Esquema para crear un nuevo usuario"""
@@ -1,68 +1,107 @@
+from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text, desc, asc
+from sqlalchemy import text, desc, asc, func, Text
 from sqlalchemy.future import select
 from app.schemas.informes import RankingUsuarioOut
 from app.models import Usuario, Participacion, Resultado, Grupo
+from app.models.participacion import EstadoParticipacion
+
+# Una sola sentencia para ambos informes: el estado va como parámetro, así SQLAlchemy y
+# asyncpg reutilizan la misma sentencia preparada
+_USUARIOS_POR_ESTADO = text("""
+    SELECT u.id_usuario, u.nombre, p.started_at, p.finished_at
+    FROM trivia.participaciones p
+    JOIN trivia.usuarios u USING (id_usuario)
+    WHERE p.estado = :estado
+""")
+
+# Duración como HH:MM:SS con las horas totales: to_char(interval, 'HH24') no suma los días
+# que el interval guarda aparte ('1 day 02:00:00' saldría como 02:00:00), así que las horas
+# salen de los segundos totales (mínimo dos dígitos, sin truncar 100 o más) y to_char del
+# interval solo aporta minutos y segundos
+_HORAS_TOTALES = func.floor(func.extract("epoch", Resultado.tiempo_total) / 3600)
+_TIEMPO_JUEGO = (
+    func.to_char(_HORAS_TOTALES, "FM9999999900", type_=Text)
+    + func.to_char(Resultado.tiempo_total, ":MI:SS", type_=Text)
+)
+
+async def _usuarios_por_estado(db: AsyncSession, estado: EstadoParticipacion):
+    result = await db.execute(_USUARIOS_POR_ESTADO, {"estado": estado.value})
+    return result.all()
 
 async def usuarios_pendientes(db: AsyncSession):
-    query = text("""
-        SELECT u.id_usuario, u.nombre, p.started_at
-        FROM trivia.participaciones p
-        JOIN trivia.usuarios u USING (id_usuario)
-        WHERE p.estado = 'Pendiente'
-    """)
-    result = await db.execute(query)
-    return result.fetchall()
+    rows = await _usuarios_por_estado(db, EstadoParticipacion.pendiente)
+    return [
+        {"id_usuario": row.id_usuario, "nombre": row.nombre, "started_at": row.started_at}
+        for row in rows
+    ]
 
 async def usuarios_finalizados(db: AsyncSession):
-    query = text("""
-        SELECT u.id_usuario, u.nombre, p.finished_at
-        FROM trivia.participaciones p
-        JOIN trivia.usuarios u USING (id_usuario)
-        WHERE p.estado = 'Finalizado'
-    """)
-    result = await db.execute(query)
-    return result.fetchall()
+    rows = await _usuarios_por_estado(db, EstadoParticipacion.finalizado)
+    return [
+        {"id_usuario": row.id_usuario, "nombre": row.nombre, "finished_at": row.finished_at}
+        for row in rows
+    ]
 
-async def ranking_usuarios(
+async def iter_ranking_usuarios(
     db: AsyncSession,
     grupo_id: int = None,
-    numero_intento: int = None
-) -> list[RankingUsuarioOut]:
+    numero_intento: int = None,
+    lote: int = 500
+) -> AsyncIterator[RankingUsuarioOut]:
+    """
+    Recorre el ranking de usuarios sin cargarlo completo en memoria.
+
+    Las filas se leen con un cursor del servidor en lotes de `lote` (`yield_per`).
+
+    Args:
+        db (AsyncSession): Sesión de base de datos; debe seguir abierta durante el recorrido.
+        grupo_id (int, optional): Filtra por grupo.
+        numero_intento (int, optional): Filtra por número de intento.
+        lote (int): Filas por lote.
+
+    Yields:
+        RankingUsuarioOut: Cada posición del ranking, en orden.
+    """
+    # La posición se numera en SQL con el mismo orden del ranking; ordenar por ella
+    # mantiene la numeración y el orden de las filas consistentes en los empates
+    posicion = func.row_number().over(
+        order_by=(desc(Resultado.respuestas_correctas), asc(Resultado.tiempo_total))
+    ).label("ranking")
     stmt = (
         select(
+            posicion,
             Usuario.cedula,
             Usuario.nombre,
-            Grupo.nombre_grupo,
-            Resultado.tiempo_total,
+            # Texto ya listo desde PostgreSQL (model_construct no valida ni convierte)
+            func.coalesce(Grupo.nombre_grupo, "").label("nombre_grupo"),
+            _TIEMPO_JUEGO.label("tiempo_juego"),
             Resultado.total_preguntas,
             Resultado.respuestas_correctas,
         )
         .join(Participacion, Usuario.id_usuario == Participacion.id_usuario)
         .join(Resultado, Participacion.id_participacion == Resultado.id_participacion)
         .join(Grupo, Participacion.id_grupo == Grupo.id_grupo)
-        .where(
-            (Participacion.id_grupo == grupo_id if grupo_id is not None else True),
-            (Participacion.numero_intento == numero_intento if numero_intento is not None else True)
-        )
-        .order_by(
-            desc(Resultado.respuestas_correctas),
-            asc(Resultado.tiempo_total)
-        )
+        .order_by(posicion)
     )
 
-    result = await db.execute(stmt)
-    rows = result.all()
+    # Solo se agregan los filtros presentes (sin predicados `true` de relleno)
+    if grupo_id is not None:
+        stmt = stmt.where(Participacion.id_grupo == grupo_id)
+    if numero_intento is not None:
+        stmt = stmt.where(Participacion.numero_intento == numero_intento)
 
-    return [
-        RankingUsuarioOut(
-            ranking              = idx + 1,
-            cedula               = row[0],
-            nombre               = row[1],
-            grupo                = str(row[2]),
-            tiempo_juego         = str(row[3]),
-            total_preguntas      = row[4],
-            respuestas_correctas = row[5],
+    result = await db.stream(stmt.execution_options(yield_per=lote))
+
+    # model_construct omite la validación: las columnas del SELECT ya tienen los tipos del
+    # esquema. Si RankingUsuarioOut agrega validadores, volver al constructor normal
+    async for ranking, cedula, nombre, grupo, tiempo, total_preguntas, correctas in result:
+        yield RankingUsuarioOut.model_construct(
+            ranking              = ranking,
+            cedula               = cedula,
+            nombre               = nombre,
+            grupo                = grupo,
+            tiempo_juego         = tiempo,
+            total_preguntas      = total_preguntas,
+            respuestas_correctas = correctas,
         )
-        for idx, row in enumerate(rows)
-    ]
\ No newline at end of file
@@ -10,12 +10,14 @@ Este módulo contiene la lógica de negocio para:
 - Listar todas las participaciones
 """
 
-from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, Optional, List
+import time
+from datetime import timedelta
+from typing import Dict, Any, Optional, List, Tuple
 from asyncpg import PostgresError
 import asyncpg
 from fastapi import HTTPException, status
-from sqlalchemy import update, select, text
+from sqlalchemy import select, delete, text, func, bindparam
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import joinedload
@@ -23,11 +25,128 @@ from sqlalchemy.orm import joinedload
 from app.models.participacion import Participacion, EstadoParticipacion
 from app.models.usuario import Usuario
 from app.models.grupo import Grupo
-from app.crud.crud_grupos import get_grupo_by_id
+from app.crud.crud_grupos import get_periodo_grupo, get_grupo_activo
+from app.core.cache import TTLCache
 
 from app.core.logger import MyLogger
 logger = MyLogger().get_logger()
 
+GRUPO_NO_ENCONTRADO = "Grupo no encontrado"
+GRUPO_CERRADO = "El grupo está cerrado o aún no ha iniciado"
+PARTICIPACION_NO_ENCONTRADA = "Participación no encontrada"
+PARTICIPACION_FINALIZADA = "La participación ya está finalizada."
+
+# Páginas del listado por estado, consultado en sondeo por tableros durante un evento. El TTL
+# corto acota el desfase entre workers; las escrituras del propio worker la vacían
+_listado_estado_cache = TTLCache(ttl=3, maxsize=256)
+
+# Llamada a la función almacenada, parseada una sola vez (los valores se pasan al ejecutar)
+_GESTIONAR_PARTICIPACION = text("""
+    SELECT action, id_part, respuestas, started_at, finished_at, tiempo_tot, remaining, intento
+    FROM trivia.gestionar_participacion(:nombre, :cedula, :grupo_id)
+""")
+
+# Cierre de un intento: separa en SQL las respuestas abiertas de las de opción única a partir
+# del JSONB enviado una sola vez (`:payload`) y solo actualiza si el intento no está finalizado
+_FINALIZAR_PARTICIPACION = text("""
+    UPDATE trivia.participaciones
+       SET respuestas_usuario = COALESCE((
+               SELECT jsonb_agg(r.e ORDER BY r.i)
+                 FROM jsonb_array_elements(:payload) WITH ORDINALITY AS r(e, i)
+                WHERE r.e->>'tipo_pregunta' IS DISTINCT FROM 'abierta'
+           ), '[]'::jsonb),
+           respuestas_abiertas = COALESCE((
+               SELECT jsonb_agg(jsonb_build_object(
+                          'id_pregunta', r.e->'id_pregunta',
+                          'respuesta_abierta', r.e->'respuesta_abierta'
+                      ) ORDER BY r.i)
+                 FROM jsonb_array_elements(:payload) WITH ORDINALITY AS r(e, i)
+                WHERE r.e->>'tipo_pregunta' = 'abierta'
+           ), '[]'::jsonb),
+           tiempo_total = :tiempo_total,
+           finished_at  = now(),
+           estado       = 'finalizado'
+     WHERE id_participacion = :id_participacion
+       AND estado <> 'finalizado'
+    RETURNING id_participacion
+""").bindparams(bindparam("payload", type_=JSONB))
+
+# Columnas de ParticipacionOut (con las del usuario anidado) para los listados que no
+# necesitan instancias ORM
+_COLUMNAS_PARTICIPACION = (
+    Participacion.id_participacion,
+    Participacion.id_grupo,
+    Participacion.numero_intento,
+    Participacion.estado,
+    Participacion.started_at,
+    Participacion.finished_at,
+    Participacion.tiempo_total,
+    Participacion.id_usuario,
+    Usuario.nombre,
+    Usuario.cedula
+)
+
+def _participacion_dict(row) -> Dict[str, Any]:
+    """Arma una participación con su usuario anidado a partir de una fila de `_COLUMNAS_PARTICIPACION`."""
+    return {
+        "id_participacion": row.id_participacion,
+        "id_grupo":         row.id_grupo,
+        "numero_intento":   row.numero_intento,
+        "estado":           row.estado,
+        "started_at":       row.started_at,
+        "finished_at":      row.finished_at,
+        "tiempo_total":     row.tiempo_total,
+        "usuario": {
+            "id_usuario": row.id_usuario,
+            "nombre":     row.nombre,
+            "cedula":     row.cedula
+        }
+    }
+
+async def _paginar(
+    db: AsyncSession,
+    stmt,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    convertir=None
+) -> Tuple[List[Any], int]:
+    """
+    Ejecuta una consulta de participaciones paginada y obtiene el total en el mismo viaje.
+
+    El total se calcula en SQL con `COUNT(*) OVER ()`, evitando materializar todas las filas
+    para contarlas en Python. Solo si la página llega vacía (offset fuera de rango) se lanza
+    un `COUNT(*)` aparte para informar el total real.
+
+    Args:
+        db (AsyncSession): Sesión de base de datos
+        stmt (Select): Consulta base de participaciones, ya filtrada y ordenada
+        limit (Optional[int]): Máximo de filas a devolver (None = sin límite)
+        offset (int): Número de filas a omitir
+        convertir (Optional[Callable]): Convierte cada fila; por defecto se toma la entidad
+            de la primera columna
+
+    Returns:
+        Tuple[List[Any], int]: Participaciones de la página y total de coincidencias
+    """
+    paginado = stmt.add_columns(func.count().over().label("total"))
+    if limit is not None:
+        paginado = paginado.limit(limit)
+    if offset:
+        paginado = paginado.offset(offset)
+
+    result = await db.execute(paginado)
+    rows = result.all()
+    if rows:
+        if convertir is None:
+            return [row[0] for row in rows], rows[0].total
+        return [convertir(row) for row in rows], rows[0].total
+    if not offset:
+        return [], 0
+
+    conteo = select(func.count()).select_from(stmt.order_by(None).subquery())
+    total = (await db.execute(conteo)).scalar_one()
+    return [], total
+
 
 async def gestionar_participacion(
     db: AsyncSession,
@@ -42,27 +161,24 @@ async def gestionar_participacion(
     - Lee el campo `remaining` devuelto para el tiempo restante
     """
     # 1. Validar que el grupo exista y esté activo
-    grupo = await  get_grupo_by_id(db, grupo_id)
-    if not grupo:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Grupo no encontrado"
-        )
-
-    now = datetime.now(timezone.utc)
-    if not (grupo.fecha_inicio <= now <= grupo.fecha_cierre):
+    if not await get_grupo_activo(db, grupo_id, time.time()):
+        # Solo en el caso poco frecuente de fallo se distingue 404 de 403
+        if not await get_periodo_grupo(db, grupo_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=GRUPO_NO_ENCONTRADO
+            )
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="El grupo está cerrado o aún no ha iniciado"
+            detail=GRUPO_CERRADO
         )
 
     try:
-        # 3. Invocar la función almacenada
-        func = text("""
-            SELECT action, id_part, respuestas, started_at, finished_at, tiempo_tot, remaining
-            FROM trivia.gestionar_participacion(:nombre, :cedula, :grupo_id)
-        """).bindparams(nombre=nombre, cedula=cedula, grupo_id=grupo_id)
-        result = await db.execute(func)
+        # 2. Invocar la función almacenada (un solo viaje: usuario, intento y participación)
+        result = await db.execute(
+            _GESTIONAR_PARTICIPACION,
+            {"nombre": nombre, "cedula": cedula, "grupo_id": grupo_id}
+        )
         row = result.fetchone()
 
         if not row or row.id_part is None:
@@ -71,18 +187,11 @@ async def gestionar_participacion(
                 detail="No se pudo iniciar o recuperar la participación"
             )
 
-        # 3. Obtener número de intento
-        intento_res = await db.execute(
-            text("""
-                SELECT numero_intento
-                FROM trivia.participaciones
-                WHERE id_participacion = :id_part
-            """).bindparams(id_part=row.id_part)
-        )
-        numero_intento = intento_res.scalar_one_or_none() or 1
+        numero_intento = row.intento or 1
 
-        # 4. Commit y retornar
+        # 3. Commit y retornar
         await db.commit()
+        _listado_estado_cache.invalidate()
 
         return {
             "action":            row.action,
@@ -102,15 +211,17 @@ async def finalizar_participacion(
     db: AsyncSession,
     id_participacion: int,
     respuestas_usuario: list[dict],  # Puede incluir abiertas y opción única
-    tiempo_total: str
+    tiempo_total: timedelta
 ) -> dict:
     """
     Finaliza una participación de trivia actualizando su estado y registrando las respuestas.
 
     Esta función realiza las siguientes acciones:
-    - Valida la existencia de la participación.
-    - Verifica que no esté ya finalizada.
-    - Registra las respuestas seleccionadas por el usuario en formato JSONB.
+    - Actualiza la participación solo si existe y no está finalizada (un único
+      `UPDATE ... RETURNING`); si no se actualizó nada, consulta el estado para
+      distinguir el error.
+    - Registra las respuestas en formato JSONB; la separación entre abiertas y de opción
+      única se hace en SQL sobre la lista enviada una sola vez.
     - Establece el tiempo total de resolución.
     - Marca la participación como finalizada (`estado = 'Finalizado'`).
     - El trigger de base de datos se encarga de calcular:
@@ -121,7 +232,7 @@ async def finalizar_participacion(
         db (AsyncSession): Sesión asíncrona de SQLAlchemy.
         id_participacion (int): ID de la participación a finalizar.
         respuestas_usuario (list[dict]): Lista de objetos con `id_pregunta` y `respuesta_seleccionada`.
-        tiempo_total (str): Duración total en formato "HH:MM:SS".
+        tiempo_total (timedelta): Duración total del intento.
 
     Returns:
         dict: Un mensaje de éxito con el ID de participación finalizada.
@@ -131,61 +242,40 @@ async def finalizar_participacion(
             - 404: Si no se encuentra la participación.
             - 400: Si la participación ya está finalizada.
     """
-    # Obtener participación existente
-    stmt = select(Participacion).where(Participacion.id_participacion == id_participacion)
-    result = await db.execute(stmt)
-    participacion = result.scalar_one_or_none()
-
-    if not participacion:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Participación no encontrada."
-        )
-
-    if participacion.estado == "finalizado":
+    # Separación de respuestas, validación del estado y escritura en un solo UPDATE ... RETURNING
+    result = await db.execute(
+        _FINALIZAR_PARTICIPACION,
+        {
+            "payload": respuestas_usuario,
+            "tiempo_total": tiempo_total,
+            "id_participacion": id_participacion
+        }
+    )
+    if result.scalar_one_or_none() is None:
+        # Solo en el caso de error se consulta el estado para distinguir 404 de 400
+        stmt = select(Participacion.estado).where(Participacion.id_participacion == id_participacion)
+        if (await db.execute(stmt)).scalar_one_or_none() is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=PARTICIPACION_NO_ENCONTRADA
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="La participación ya está finalizada."
+            detail=PARTICIPACION_FINALIZADA
         )
 
-    # Preparar datos para actualizar
-    # Parsear el string "HH:MM:SS" a timedelta
-    horas, minutos, segundos = map(int, tiempo_total.split(":"))
-    duracion = timedelta(hours=horas, minutes=minutos, seconds=segundos)
-
-    # Separar respuestas abiertas y de opción única
-    respuestas_opcion = []
-    respuestas_abiertas = []
-    for resp in respuestas_usuario:
-        if resp.get("tipo_pregunta") == "abierta":
-            respuestas_abiertas.append({
-                "id_pregunta": resp["id_pregunta"],
-                "respuesta_abierta": resp.get("respuesta_abierta")
-            })
-        else:
-            respuestas_opcion.append(resp)
-
-    # Guardar ambas en la BD (puedes ajustar el modelo para soportar ambos campos si es necesario)
-    stmt_update = (
-        update(Participacion)
-        .where(Participacion.id_participacion == id_participacion)
-        .values(
-            respuestas_usuario=respuestas_opcion,
-            respuestas_abiertas=respuestas_abiertas,
-            tiempo_total=duracion,
-            finished_at = datetime.now(timezone.utc),
-            estado="finalizado"
-        )
-    )
-
-    await db.execute(stmt_update)
     await db.commit()
+    _listado_estado_cache.invalidate()
 
     return {"mensaje": "Participación finalizada correctamente", "id": id_participacion}
 
 async def eliminar_participacion(db: AsyncSession, id_participacion: int) -> None:
     """
-    Elimina una participación por su ID.
+    Elimina una participación por su ID con un único `DELETE ... RETURNING`.
+
+    Las filas de `respuestas_usuarios` y `resultados` se borran en la misma sentencia por
+    `ON DELETE CASCADE`, apoyado en los índices únicos que ambas tablas tienen sobre
+    `id_participacion`; no hace falta diferir la limpieza fuera de la respuesta.
 
     Args:
         db (AsyncSession): Sesión de base de datos
@@ -194,57 +284,78 @@ async def eliminar_participacion(db: AsyncSession, id_participacion: int) -> Non
     Raises:
         HTTPException: 404 si la participación no existe
     """
-    participacion = await db.get(Participacion, id_participacion)
-    if not participacion:
+    stmt = (
+        delete(Participacion)
+        .where(Participacion.id_participacion == id_participacion)
+        .returning(Participacion.id_participacion)
+    )
+    result = await db.execute(stmt)
+    if result.scalar_one_or_none() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Participación no encontrada"
+            detail=PARTICIPACION_NO_ENCONTRADA
         )
-    
-    await db.delete(participacion)
+
     await db.commit()
+    _listado_estado_cache.invalidate()
 
 async def get_participaciones_por_estado(
     db: AsyncSession,
     estado: EstadoParticipacion,
     id_evento: Optional[int] = None,
-    id_grupo: Optional[int] = None
-) -> List[Participacion]:
+    id_grupo: Optional[int] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Tuple[List[Dict[str, Any]], int]:
     """
-    Obtiene todas las participaciones que tienen un estado específico.
+    Obtiene las participaciones que tienen un estado específico.
+
+    Las páginas se guardan unos segundos en una caché en memoria por combinación de filtros;
+    gestionar, finalizar y eliminar participaciones la vacían. Se cachean diccionarios con
+    las columnas de `ParticipacionOut`, no instancias ORM ligadas a la sesión que las cargó.
 
     Args:
         db (AsyncSession): Sesión de base de datos
         estado (EstadoParticipacion): Estado de las participaciones a buscar
+        limit (Optional[int]): Máximo de filas a devolver (None = sin límite)
+        offset (int): Número de filas a omitir
 
     Returns:
-        List[Participacion]: Lista de participaciones con el estado especificado y datos del usuario
+        Tuple[List[Dict[str, Any]], int]: Página de participaciones con datos del usuario y total
     """
+    clave = (estado.value, id_evento, id_grupo, limit, offset)
+    pagina = _listado_estado_cache.get(clave)
+    if pagina is not None:
+        return pagina
+
     stmt = (
-        select(Participacion)
-        .options(joinedload(Participacion.usuario))
-        .where(Participacion.estado == estado)
+        select(*_COLUMNAS_PARTICIPACION)
+        .join(Usuario, Usuario.id_usuario == Participacion.id_usuario)
+        .where(Participacion.estado == estado.value)
         .order_by(Participacion.id_participacion.asc())
     )
 
     # Aplicar filtros según los parámetros proporcionados
     if id_evento is not None:
         stmt = (
-            stmt.join(Grupo)
+            stmt.join(Grupo, Grupo.id_grupo == Participacion.id_grupo)
             .where(Grupo.id_evento == id_evento)
         )
     if id_grupo is not None:
         stmt = stmt.where(Participacion.id_grupo == id_grupo)
 
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    pagina = await _paginar(db, stmt, limit, offset, convertir=_participacion_dict)
+    _listado_estado_cache.set(clave, pagina)
+    return pagina
 
 async def get_participaciones_por_usuario_evento(
     db: AsyncSession,
     cedula: Optional[str] = None,
     id_evento: Optional[int] = None,
-    id_grupo: Optional[int] = None
-) -> List[Participacion]:
+    id_grupo: Optional[int] = None,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Tuple[List[Participacion], int]:
     """
     Obtiene participaciones filtrando por cédula del usuario, evento y/o grupo.
 
@@ -253,9 +364,11 @@ async def get_participaciones_por_usuario_evento(
         cedula (Optional[str]): Cédula del usuario para filtrar (opcional)
         id_evento (Optional[int]): ID del evento para filtrar (opcional)
         id_grupo (Optional[int]): ID del grupo para filtrar (opcional)
+        limit (Optional[int]): Máximo de filas a devolver (None = sin límite)
+        offset (int): Número de filas a omitir
 
     Returns:
-        List[Participacion]: Lista de participaciones que coinciden con los filtros
+        Tuple[List[Participacion], int]: Página de participaciones que coinciden con los filtros y total
 
     Raises:
         HTTPException: 400 si no se proporciona ningún filtro
@@ -270,7 +383,6 @@ async def get_participaciones_por_usuario_evento(
     stmt = (
         select(Participacion)
         .options(joinedload(Participacion.usuario))
-        .options(joinedload(Participacion.grupo))
     )
     
     # Aplicar filtros según los parámetros proporcionados
@@ -286,45 +398,57 @@ async def get_participaciones_por_usuario_evento(
     
     # Ordenar por fecha de inicio descendente (más recientes primero)
     stmt = stmt.order_by(Participacion.started_at.desc())
-    
-    result = await db.execute(stmt)
-    return result.scalars().all()
 
-async def get_all_participaciones(db: AsyncSession) -> List[Participacion]:
+    return await _paginar(db, stmt, limit, offset)
+
+async def get_all_participaciones(
+    db: AsyncSession,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Tuple[List[Participacion], int]:
     """
-    Obtiene todas las participaciones registradas.
+    Obtiene las participaciones registradas.
 
     Args:
         db (AsyncSession): Sesión de base de datos
+        limit (Optional[int]): Máximo de filas a devolver (None = sin límite)
+        offset (int): Número de filas a omitir
 
     Returns:
-        List[Participacion]: Lista de todas las participaciones con datos del usuario y grupo
+        Tuple[List[Participacion], int]: Página de participaciones con datos del usuario y grupo, y total
     """
     stmt = (
         select(Participacion)
         .options(joinedload(Participacion.usuario))
-        .options(joinedload(Participacion.grupo))
         .order_by(Participacion.started_at.desc())
     )
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    return await _paginar(db, stmt, limit, offset)
 
-async def get_participaciones_por_grupo(db: AsyncSession, id_grupo: int) -> List[Participacion]:
+async def get_participaciones_por_grupo(
+    db: AsyncSession,
+    id_grupo: int,
+    limit: Optional[int] = None,
+    offset: int = 0
+) -> Tuple[List[Dict[str, Any]], int]:
     """
-    Obtiene todas las participaciones de un grupo específico.
+    Obtiene las participaciones de un grupo específico.
+
+    Solo se consultan las columnas que expone `ParticipacionOut` (con un join a usuarios),
+    sin construir instancias ORM.
 
     Args:
         db (AsyncSession): Sesión de base de datos
         id_grupo (int): ID del grupo para filtrar
+        limit (Optional[int]): Máximo de filas a devolver (None = sin límite)
+        offset (int): Número de filas a omitir
 
     Returns:
-        List[Participacion]: Lista de participaciones del grupo con datos del usuario
+        Tuple[List[Dict[str, Any]], int]: Página de participaciones del grupo con datos del usuario y total
     """
     stmt = (
-        select(Participacion)
-        .options(joinedload(Participacion.usuario))
+        select(*_COLUMNAS_PARTICIPACION)
+        .join(Usuario, Usuario.id_usuario == Participacion.id_usuario)
         .where(Participacion.id_grupo == id_grupo)
         .order_by(Participacion.started_at.desc())
     )
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    return await _paginar(db, stmt, limit, offset, convertir=_participacion_dict)
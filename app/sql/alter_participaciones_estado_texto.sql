@@ -0,0 +1,19 @@
+-- Migra `participaciones.estado` del tipo ENUM `estado_participacion` a texto con CHECK
+-- (solo en bases creadas con el ENUM). El índice parcial se recrea con su script.
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+         WHERE table_schema = 'trivia' AND table_name = 'participaciones'
+           AND column_name = 'estado' AND data_type = 'USER-DEFINED'
+    ) THEN
+        DROP INDEX IF EXISTS trivia.ix_participaciones_pendientes;
+        ALTER TABLE trivia.participaciones
+            ALTER COLUMN estado DROP DEFAULT,
+            ALTER COLUMN estado TYPE varchar(12) USING estado::text;
+        ALTER TABLE trivia.participaciones
+            ADD CONSTRAINT ck_estado_participacion CHECK (estado IN ('pendiente', 'finalizado'));
+        DROP TYPE IF EXISTS trivia.estado_participacion;
+    END IF;
+END
+$$;
@@ -0,0 +1,13 @@
+-- Reduce `respuestas.orden` a smallint en bases creadas cuando era integer (solo si hace falta)
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+         WHERE table_schema = 'trivia' AND table_name = 'respuestas'
+           AND column_name = 'orden' AND data_type = 'integer'
+    ) THEN
+        ALTER TABLE trivia.respuestas ALTER COLUMN orden TYPE smallint;
+        ANALYZE trivia.respuestas;
+    END IF;
+END
+$$;
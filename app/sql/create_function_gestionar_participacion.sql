@@ -10,7 +10,8 @@ RETURNS TABLE (
     started_at  TIMESTAMP,
     finished_at TIMESTAMP,
     tiempo_tot  INTERVAL,
-    remaining   INTERVAL
+    remaining   INTERVAL,
+    intento     SMALLINT
 ) AS $$
 DECLARE
     v_user         INT;
@@ -64,6 +65,7 @@ BEGIN
         finished_at := NULL;
         tiempo_tot  := NULL;
         remaining   := '00:00:00'::interval;
+        intento     := v_intento;
         RETURN NEXT;
         RETURN;
     END IF;
@@ -95,6 +97,7 @@ BEGIN
         finished_at := v_finished_at;
         tiempo_tot  := v_tiempo_total;
         remaining   := '00:00:00'::interval;
+        intento     := v_intento;
         RETURN NEXT;
         RETURN;
     END IF;
@@ -121,6 +124,7 @@ BEGIN
             started_at  := v_start_ts;
             finished_at := v_finished_at;
             tiempo_tot  := v_tiempo_total;
+            intento     := v_intento;
             RETURN NEXT;
             RETURN;
         END IF;
@@ -147,6 +151,7 @@ BEGIN
         finished_at := v_finished_at;
         tiempo_tot  := v_tiempo_total;
         remaining   := '00:00:00'::interval;
+        intento     := v_intento;
         RETURN NEXT;
         RETURN;
     END IF;
@@ -167,6 +172,7 @@ BEGIN
     finished_at := NULL;
     tiempo_tot  := NULL;
     remaining   := '00:00:00'::interval;
+    intento     := v_intento;
     RETURN NEXT;
     RETURN;
 END;
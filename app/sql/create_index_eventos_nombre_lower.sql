@@ -0,0 +1,2 @@
+-- Unicidad del nombre del evento sin distinguir mayúsculas (para bases creadas antes del índice)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_eventos_nombre_lower ON trivia.eventos (lower(nombre_evento));
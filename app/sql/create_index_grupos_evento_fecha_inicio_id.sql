@@ -0,0 +1,2 @@
+-- Paginación por cursor de los grupos de un evento (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_grupos_evento_fecha_inicio_id ON trivia.grupos (id_evento, fecha_inicio, id_grupo);
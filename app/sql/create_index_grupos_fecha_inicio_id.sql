@@ -0,0 +1,2 @@
+-- Paginación por cursor (fecha_inicio, id_grupo) del listado de grupos (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_grupos_fecha_inicio_id ON trivia.grupos (fecha_inicio, id_grupo);
@@ -0,0 +1,2 @@
+-- Índice GiST de la vigencia de los grupos para /grupos/activos (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS idx_grupo_activo ON trivia.grupos USING gist (tstzrange(fecha_inicio, fecha_cierre, '[]'));
@@ -0,0 +1,2 @@
+-- Índice de listados por grupo ordenados por started_at (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_participaciones_grupo_started ON trivia.participaciones (id_grupo, started_at DESC);
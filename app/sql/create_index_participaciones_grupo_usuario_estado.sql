@@ -0,0 +1,2 @@
+-- Índice de cobertura de las consultas de participaciones por grupo (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_participaciones_grupo_usuario_estado ON trivia.participaciones (id_grupo, id_usuario, estado) INCLUDE (id_participacion, numero_intento, finished_at, tiempo_total);
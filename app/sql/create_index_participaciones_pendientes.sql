@@ -0,0 +1,2 @@
+-- Índice parcial de los intentos en curso (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_participaciones_pendientes ON trivia.participaciones (id_usuario, id_grupo) WHERE estado = 'pendiente';
@@ -0,0 +1,2 @@
+-- Índice BRIN de started_at para consultas por rango de fechas (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_participaciones_started_brin ON trivia.participaciones USING brin (started_at) WITH (pages_per_range = 32);
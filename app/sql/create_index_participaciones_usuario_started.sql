@@ -0,0 +1,2 @@
+-- Índice de listados por usuario ordenados por started_at (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_participaciones_usuario_started ON trivia.participaciones (id_usuario, started_at DESC);
@@ -0,0 +1,2 @@
+-- Índice de la FK respuestas_usuarios.id_pregunta para el borrado en cascada (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_respuestas_usuarios_id_pregunta ON trivia.respuestas_usuarios (id_pregunta);
@@ -0,0 +1,2 @@
+-- Índice del ranking en el orden del ORDER BY (para bases creadas antes del índice)
+CREATE INDEX IF NOT EXISTS ix_resultados_ranking ON trivia.resultados (respuestas_correctas DESC, tiempo_total) INCLUDE (id_participacion, total_preguntas);
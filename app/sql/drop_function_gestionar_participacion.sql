@@ -0,0 +1,2 @@
+-- Eliminar la función si ya existe (necesario al cambiar sus columnas de retorno)
+DROP FUNCTION IF EXISTS trivia.gestionar_participacion(VARCHAR, VARCHAR, INT);
\ No newline at end of file
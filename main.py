@@ -8,14 +8,28 @@ Attributes:
     app (FastAPI): The FastAPI application instance.
 Methods:
     lifespan(): Lifecycle handler that runs on startup to initialize database.
+    http_exception_handler(): Serializes HTTPException responses with orjson.
+    validation_exception_handler(): Serializes 422 validation errors with orjson.
+    integrity_error_handler(): Maps database integrity conflicts to HTTP 400.
+    sqlalchemy_error_handler(): Maps any other database error to HTTP 500.
 """
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.utils import get_openapi
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.db.init_db import init
 from app.api.routers import api_router
+from app.core.logger import MyLogger
+from app.core.etag import ETagMiddleware
+from app.core.config import ALLOWED_ORIGINS
+
+logger = MyLogger().get_logger()
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
@@ -26,8 +40,9 @@ async def lifespan(_: FastAPI):
     It's useful for initializing connections, loading configs, etc.
     """
     await init()  # Initializes database or other services
+    app.openapi()  # Builds the OpenAPI schema once, before the first request
     yield
-    # You can optionally clean up resources here
+    MyLogger.detener()  # Flushes queued log records before the worker exits
 
 # Create FastAPI instance with custom lifespan
 app = FastAPI(
@@ -35,19 +50,23 @@ app = FastAPI(
     description="API para gestionar eventos, usuarios y trivias",
     version="1.0.0",
     debug=True,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse  # Serialización JSON en C (orjson)
 )
 
 # Enable CORS (recommended for frontend-backend integration)
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Update this with your frontend URL in production
-    allow_credentials=True,
+    allow_origins=ALLOWED_ORIGINS,  # ALLOWED_ORIGINS en el entorno, p. ej. la URL del frontend
+    allow_credentials=False,        # Auth por header Bearer: "*" se responde como encabezado fijo
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Custom OpenAPI for JWT Bearer auth in Swagger UI
+# ETag + 304 Not Modified para los GET que devuelven JSON
+app.add_middleware(ETagMiddleware)
+
+# Custom OpenAPI for JWT Bearer auth in Swagger UI (built at startup, cached on the app)
 def custom_openapi():
     if app.openapi_schema:
         return app.openapi_schema
@@ -72,6 +91,41 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+# Global exception handlers (registered once, no per-endpoint try/except)
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(_: Request, exc: StarletteHTTPException):
+    """Same contract as FastAPI's default handler, but encoded with orjson instead of stdlib json."""
+    headers = getattr(exc, "headers", None)
+    if exc.status_code in (status.HTTP_204_NO_CONTENT, status.HTTP_304_NOT_MODIFIED):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(_: Request, exc: RequestValidationError):
+    """Returns the usual 422 body ({"detail": [...]}) encoded with orjson."""
+    return ORJSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors())}
+    )
+
+@app.exception_handler(IntegrityError)
+async def integrity_error_handler(request: Request, exc: IntegrityError):
+    """Returns 400 when a write violates a unique, foreign key or check constraint."""
+    logger.warning("Conflicto de integridad en %s %s: %s", request.method, request.url.path, exc.orig)
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": "La operación viola una restricción de integridad de los datos"}
+    )
+
+@app.exception_handler(SQLAlchemyError)
+async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
+    """Logs the full traceback and returns a generic 500 without leaking database details."""
+    logger.error("Error de base de datos en %s %s", request.method, request.url.path, exc_info=exc)
+    return ORJSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={"detail": "Error interno de base de datos"}
+    )
+
 # Register API routers
 app.include_router(api_router)
 